@@ -8,7 +8,12 @@ so that downstream services can decide capabilities at runtime.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Final
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 __all__ = [
     "LanguageConfig",
@@ -57,7 +62,9 @@ class LanguageConfig:
 # Language registry
 # ---------------------------------------------------------------------------
 
-LANGUAGES: Final[dict[str, LanguageConfig]] = {
+# Read-only views: the registry is shared process-wide and must never be
+# mutated at runtime.
+LANGUAGES: Final[Mapping[str, LanguageConfig]] = MappingProxyType({
     # ── High-priority languages (top 10 by speaker count) ──────────────
     "hi": LanguageConfig(
         code="hi",
@@ -313,14 +320,14 @@ LANGUAGES: Final[dict[str, LanguageConfig]] = {
         population_millions=0.025,
         is_high_priority=False,
     ),
-}
+})
 
 
 # ---------------------------------------------------------------------------
 # Alternate code lookup table
 # ---------------------------------------------------------------------------
 
-LANGUAGE_CODE_MAP: Final[dict[str, str]] = {
+LANGUAGE_CODE_MAP: Final[Mapping[str, str]] = MappingProxyType({
     # ISO 639-2/T and 639-2/B alternates
     "hin": "hi",
     "ben": "bn",
@@ -359,7 +366,43 @@ LANGUAGE_CODE_MAP: Final[dict[str, str]] = {
     "ml-IN": "ml",
     "pa-IN": "pa",
     "ne-NP": "ne",
-}
+})
+
+
+# ---------------------------------------------------------------------------
+# Precomputed views
+# ---------------------------------------------------------------------------
+# The registry is immutable, so the sorted/filtered views are built once at
+# import instead of re-sorting on every call.  The helpers hand out these
+# tuples directly; callers that need a mutable copy should wrap in ``list()``.
+
+# Every accepted code (canonical + aliases) mapped straight to its config,
+# so ``get_language`` resolves in a single dict probe.  Aliases share the
+# canonical ``LanguageConfig`` instance, so downstream caches may key on the
+# config object itself rather than on the code string.  Lower-cased keys are
+# added alongside the originals so mixed-case input (``HI-IN``, ``Hi``) only
+# pays for a ``.lower()`` when the exact-case probe misses.
+_all_codes: dict[str, LanguageConfig] = dict(LANGUAGES)
+for _alias, _canonical in LANGUAGE_CODE_MAP.items():
+    if _canonical in LANGUAGES:
+        _all_codes[_alias] = LANGUAGES[_canonical]
+for _code, _config in list(_all_codes.items()):
+    _all_codes.setdefault(_code.lower(), _config)
+_ALL_CODES: Final[Mapping[str, LanguageConfig]] = MappingProxyType(_all_codes)
+del _all_codes, _alias, _canonical, _code, _config
+
+# Longest accepted code; anything longer is rejected without normalising it.
+_MAX_CODE_LENGTH: Final[int] = max(map(len, _ALL_CODES))
+
+_SUPPORTED_SORTED: Final[tuple[LanguageConfig, ...]] = tuple(
+    sorted(LANGUAGES.values(), key=attrgetter("population_millions"), reverse=True)
+)
+_HIGH_PRIORITY_SORTED: Final[tuple[LanguageConfig, ...]] = tuple(
+    lang for lang in _SUPPORTED_SORTED if lang.is_high_priority
+)
+_GCP_TTS_SORTED: Final[tuple[LanguageConfig, ...]] = tuple(
+    lang for lang in _SUPPORTED_SORTED if lang.gcp_tts_code is not None
+)
 
 
 # ---------------------------------------------------------------------------
@@ -370,30 +413,24 @@ LANGUAGE_CODE_MAP: Final[dict[str, str]] = {
 def get_language(code: str) -> LanguageConfig | None:
     """Return the ``LanguageConfig`` for *code*, checking aliases.
 
-    Returns ``None`` if the language is not found.
+    Lookup is case-insensitive.  Returns ``None`` if the language is not found.
     """
-    canonical = LANGUAGE_CODE_MAP.get(code, code)
-    return LANGUAGES.get(canonical)
+    config = _ALL_CODES.get(code)
+    if config is None and len(code) <= _MAX_CODE_LENGTH:
+        config = _ALL_CODES.get(code.lower())
+    return config
 
 
-def get_supported_languages() -> list[LanguageConfig]:
+def get_supported_languages() -> tuple[LanguageConfig, ...]:
     """Return all supported languages sorted by speaker count (descending)."""
-    return sorted(LANGUAGES.values(), key=lambda lang: lang.population_millions, reverse=True)
+    return _SUPPORTED_SORTED
 
 
-def get_high_priority_languages() -> list[LanguageConfig]:
+def get_high_priority_languages() -> tuple[LanguageConfig, ...]:
     """Return the top-10 high-priority languages sorted by speaker count (descending)."""
-    return sorted(
-        (lang for lang in LANGUAGES.values() if lang.is_high_priority),
-        key=lambda lang: lang.population_millions,
-        reverse=True,
-    )
+    return _HIGH_PRIORITY_SORTED
 
 
-def get_gcp_tts_languages() -> list[LanguageConfig]:
+def get_gcp_tts_languages() -> tuple[LanguageConfig, ...]:
     """Return languages that have Google Cloud TTS support."""
-    return sorted(
-        (lang for lang in LANGUAGES.values() if lang.gcp_tts_code is not None),
-        key=lambda lang: lang.population_millions,
-        reverse=True,
-    )
+    return _GCP_TTS_SORTED
@@ -8,7 +8,7 @@ their canonical environment variable names via ``validation_alias``.
 from __future__ import annotations
 
 from enum import StrEnum
-from typing import Literal
+from functools import lru_cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -36,7 +36,7 @@ class Settings(BaseSettings):
     )
 
     # ── App ────────────────────────────────────────────────────────────
-    env: Literal["development", "production"] = "development"
+    env: Environment = Environment.DEVELOPMENT
 
     # ── GCP ────────────────────────────────────────────────────────────
     gcp_project_id: str = Field(default="", validation_alias="GCP_PROJECT_ID")
@@ -68,6 +68,12 @@ class Settings(BaseSettings):
 
     # ── Admin API Key ──────────────────────────────────────────────────
     admin_api_key: str = Field(default="", validation_alias="ADMIN_API_KEY")
+    # Emit structured-log lines for high-frequency admin actions (e.g. status
+    # polling).  They are always kept in the in-memory audit log.
+    admin_audit_verbose: bool = Field(default=False, validation_alias="ADMIN_AUDIT_VERBOSE")
+    # Directory for admin rollback snapshots.  Empty keeps the compressed
+    # snapshots in process memory.
+    admin_snapshot_dir: str = Field(default="", validation_alias="ADMIN_SNAPSHOT_DIR")
 
     # ── Logging ────────────────────────────────────────────────────────
     log_level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
@@ -152,7 +158,7 @@ class Settings(BaseSettings):
 
     @property
     def is_production(self) -> bool:
-        return self.env == Environment.PRODUCTION
+        return self.env is Environment.PRODUCTION
 
     @property
     def cors_origin_list(self) -> list[str]:
@@ -160,5 +166,15 @@ class Settings(BaseSettings):
         return [o.strip() for o in self.cors_origins.split(",") if o.strip()]
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide ``Settings`` instance.
+
+    Environment and ``.env`` parsing happens once per process; usable
+    directly or as a FastAPI dependency (``Depends(get_settings)``).
+    """
+    return Settings()
+
+
 # Module-level singleton — import ``settings`` everywhere.
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,34 @@
+"""Conditional-request helpers shared by the v1 route modules.
+
+Endpoints that serve a pre-serialised body with an ``ETag`` use
+:func:`etag_matches` to decide whether a request's ``If-None-Match``
+allows a ``304 Not Modified`` instead of the full body.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from fastapi import Request
+
+# One entity-tag from an ``If-None-Match`` list: optional weak prefix plus
+# the quoted opaque tag (RFC 9110 section 8.8.3).
+_ENTITY_TAG_RE: Final[re.Pattern[str]] = re.compile(r'(?:W/)?("[^"]*")')
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return whether *request*'s ``If-None-Match`` matches *etag*.
+
+    Follows RFC 9110 section 13.1.2: the header is either ``*`` or a
+    comma-separated list of entity-tags, compared weakly, so ``W/"x"``
+    and ``"x"`` match each other.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag == opaque for tag in _ENTITY_TAG_RE.findall(header))
@@ -15,6 +15,12 @@ Includes:
     * Nearby Services: CSC, DLSA, office finder
     * Accessibility: ISL, screen reader, haptic, Braille support
     * Self-Sustaining: health checks, cost monitoring, auto-updates
+
+Importing this module must stay side-effect free (no I/O, no service
+construction): the router is assembled once when ``src.main`` is imported,
+and all per-process state is created in the application lifespan instead.
+That keeps the import safe to perform ahead of worker start-up by a
+pre-forking server.
 """
 
 from __future__ import annotations
@@ -44,24 +50,27 @@ from src.api.v1 import (
 
 api_router = APIRouter(prefix="/api/v1")
 
-# -- Core sub-routers ------------------------------------------------------
-api_router.include_router(query.router)
-api_router.include_router(schemes.router)
-api_router.include_router(profile.router)
-api_router.include_router(health.router)
-api_router.include_router(languages.router)
-api_router.include_router(ingestion.router)
-api_router.include_router(verification.router)
-api_router.include_router(feedback.router)
-
-# -- New feature sub-routers -----------------------------------------------
-api_router.include_router(voice_agent.router)
-api_router.include_router(document_scanner.router)
-api_router.include_router(legal_rights.router)
-api_router.include_router(rti.router)
-api_router.include_router(emergency.router)
-api_router.include_router(grievance.router)
-api_router.include_router(nearby.router)
-api_router.include_router(accessibility.router)
-api_router.include_router(self_sustaining.router)
-api_router.include_router(admin_recovery.router)
+for _module in (
+    # -- Core sub-routers ----------------------------------------------------
+    query,
+    schemes,
+    profile,
+    health,
+    languages,
+    ingestion,
+    verification,
+    feedback,
+    # -- New feature sub-routers ---------------------------------------------
+    voice_agent,
+    document_scanner,
+    legal_rights,
+    rti,
+    emergency,
+    grievance,
+    nearby,
+    accessibility,
+    self_sustaining,
+    admin_recovery,
+):
+    api_router.include_router(_module.router)
+del _module
@@ -6,28 +6,58 @@ for blind, deaf, and users with other disabilities.
 
 from __future__ import annotations
 
+from typing import Annotated, Final
+
 import structlog
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 
-logger = structlog.get_logger(__name__)
+from src.services.accessibility import AccessibilityMode, AccessibilityService
+
+logger = structlog.get_logger(__name__).bind(endpoint="accessibility")
 
 router = APIRouter(prefix="/accessibility", tags=["accessibility"])
 
+# Mode string -> enum member, so invalid modes are a dict miss rather than
+# an exception raised from ``AccessibilityMode.__call__``.
+_MODE_LOOKUP: Final[dict[str, AccessibilityMode]] = {m.value: m for m in AccessibilityMode}
+
+# Human-readable list of valid modes, shared by the schema and error detail.
+_VALID_MODES_TEXT: Final[str] = ", ".join(_MODE_LOOKUP)
+
+# Modes in which the service rewrites ``text`` into its simplified form.
+_SIMPLIFYING_MODES: Final[frozenset[AccessibilityMode]] = frozenset(
+    {AccessibilityMode.SIMPLIFIED, AccessibilityMode.SIGN_LANGUAGE}
+)
+
 
 class AccessibleResponseRequest(BaseModel):
+    model_config = {"frozen": True, "extra": "forbid"}
+
     text: str = Field(..., min_length=1, max_length=10000)
     mode: str = Field(
         default="screen_reader",
-        description="Mode: screen_reader, sign_language, simplified, audio_description, haptic, braille",
+        description=f"Mode: {_VALID_MODES_TEXT}",
     )
     language: str = Field(default="hi")
     speech_speed: float = Field(default=1.0, ge=0.25, le=2.0)
 
 
+def _get_accessibility(request: Request) -> AccessibilityService:
+    """Retrieve the accessibility service from app state, or raise 503."""
+    a11y = getattr(request.app.state, "accessibility", None)
+    if a11y is None:
+        raise HTTPException(status_code=503, detail="Accessibility service not available")
+    return a11y
+
+
+AccessibilityDep = Annotated[AccessibilityService, Depends(_get_accessibility)]
+
+
 @router.post("/generate")
 async def generate_accessible_response(
-    body: AccessibleResponseRequest, request: Request
+    body: AccessibleResponseRequest,
+    a11y: AccessibilityDep,
 ) -> dict:
     """Generate an accessible version of text content.
 
@@ -39,47 +69,35 @@ async def generate_accessible_response(
     - haptic: Vibration patterns for alerts
     - braille: Braille-ready formatted text
     """
-    a11y = getattr(request.app.state, "accessibility", None)
-    if a11y is None:
-        raise HTTPException(status_code=503, detail="Accessibility service not available")
+    mode = _MODE_LOOKUP.get(body.mode)
+    if mode is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid mode: {body.mode}. Use: {_VALID_MODES_TEXT}",
+        )
 
     try:
-        from src.services.accessibility import AccessibilityMode
-        mode = AccessibilityMode(body.mode)
         result = await a11y.generate_accessible_response(
             text=body.text,
             mode=mode,
             language=body.language,
         )
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid mode: {body.mode}. Use: screen_reader, sign_language, simplified, audio_description, haptic, braille",
-        ) from None
     except Exception:
         logger.error("api.accessibility.generate_failed", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to generate accessible response") from None
 
+    text = result.text
+    isl = result.isl_description
+    haptic = result.haptic_pattern
     return {
         "mode": body.mode,
-        "text": result.text,
+        "text": text,
         "screen_reader_text": result.screen_reader_text,
-        "simplified_text": result.simplified_text,
+        "simplified_text": text if mode in _SIMPLIFYING_MODES else None,
         "braille_text": result.braille_text,
-        "isl_description": (
-            {
-                "gestures": result.isl_description.gestures,
-            }
-            if result.isl_description
-            else None
-        ),
+        "isl_description": {"gestures": isl.gestures} if isl else None,
         "haptic_pattern": (
-            {
-                "pattern": result.haptic_pattern.pattern,
-                "description": result.haptic_pattern.description,
-            }
-            if result.haptic_pattern
-            else None
+            {"pattern": haptic.pattern, "description": haptic.description} if haptic else None
         ),
         "language": body.language,
     }
@@ -87,35 +105,28 @@ async def generate_accessible_response(
 
 @router.post("/simplify")
 async def simplify_text(
+    a11y: AccessibilityDep,
     text: str = "",
     language: str = "hi",
-    request: Request = None,
 ) -> dict:
     """Simplify text for easy understanding.
 
     Reduces complex text to simple words and short sentences,
     suitable for users with limited literacy or cognitive challenges.
     """
-    a11y = getattr(request.app.state, "accessibility", None)
-    if a11y is None:
-        raise HTTPException(status_code=503, detail="Accessibility service not available")
-
-    simplified = await a11y.simplify_text(text)
+    simplified = a11y.simplify_text(text)
     return {"original_length": len(text), "simplified": simplified}
 
 
 @router.get("/haptic-pattern/{alert_type}")
 async def get_haptic_pattern(
-    alert_type: str, request: Request
+    alert_type: str,
+    a11y: AccessibilityDep,
 ) -> dict:
     """Get a haptic vibration pattern for a given alert type.
 
     Types: success, error, warning, urgent, notification, sos.
     """
-    a11y = getattr(request.app.state, "accessibility", None)
-    if a11y is None:
-        raise HTTPException(status_code=503, detail="Accessibility service not available")
-
     pattern = a11y.get_haptic_pattern(alert_type)
     return {
         "alert_type": alert_type,
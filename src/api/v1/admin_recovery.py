@@ -13,18 +13,41 @@ All endpoints require admin API key authentication.
 
 from __future__ import annotations
 
-import copy
+import asyncio
 import hashlib
+import os
 import time
+import zlib
+from collections import Counter, OrderedDict, deque
 from datetime import UTC, datetime
-from typing import Any
+from functools import lru_cache
+from itertools import count, islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel, Field
-
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import BaseModel, Field, TypeAdapter
+
+from config.settings import settings
+from src.api.etag import etag_matches
+from src.api.v1.feedback import (
+    _feedback_index,
+    _feedback_store,
+    _rebuild_feedback_indexes,
+)
+from src.api.v1.profile import _profiles
 from src.middleware.auth import require_admin_api_key
+from src.models.feedback import CitizenFeedback
+from src.models.scheme import SchemeDocument
+from src.models.user_profile import UserProfile
+from src.services.cache import CacheManager
+
+if TYPE_CHECKING:
+    from src.services.autofix_orchestrator import AutoFixOrchestrator
+    from src.services.claude_cli_bridge import ClaudeCLIBridge
 
 logger = structlog.get_logger(__name__)
 
@@ -39,31 +62,419 @@ router = APIRouter(
 # In-memory state for disaster recovery
 # ---------------------------------------------------------------------------
 
-_snapshots: dict[str, dict[str, Any]] = {}
-_admin_audit_log: list[dict[str, Any]] = []
+_MAX_AUDIT_ENTRIES = 1000
+_AUDIT_LOG_QUEUE_SIZE = 4096
+# Actions polled by dashboards; only written to the structured log when
+# ``settings.admin_audit_verbose`` is set.
+_QUIET_AUDIT_ACTIONS = frozenset({"status_check"})
+_MAX_ROLLBACK_POINTS = 50
+
+# Audit entry and snapshot IDs: a per-process run prefix plus a counter is
+# unique within the process and far cheaper than a fresh uuid4 per entry.
+_RUN_ID = uuid4().hex[:6]
+_id_counter = count()
+
+_CHECKSUM_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+_SNAPSHOT_COMPRESSION_LEVEL = 3
+
+# Snapshot ID -> {"meta": rollback-point metadata, plus either "blob" (the
+# compressed data) or "path" (its file under ``settings.admin_snapshot_dir``)},
+# newest first.  A single ordered map gives O(1) insert, lookup and eviction
+# of the oldest rollback point.
+_snapshots: OrderedDict[str, dict[str, Any]] = OrderedDict()
+# Version of ``_snapshots`` (bumped on every change) and the pre-serialised
+# ``/snapshots`` body for that version, used as a weak ETag.
+_snapshot_listing: dict[str, Any] = {"version": 0, "body": None}
+# Newest first; the bounded deque gives O(1) insert and eviction.
+_admin_audit_log: deque[dict[str, Any]] = deque(maxlen=_MAX_AUDIT_ENTRIES)
+# Encoded ``"schemes"`` chunk of the last ``scheme_data`` list that was
+# snapshotted, as ``(source, bytes)`` keyed on the list's identity (see
+# :func:`_scheme_id_index`).
+_scheme_chunk_cache: dict[str, Any] = {"entry": None}
+# Structured-log sink for audit entries.  While :func:`drain_audit_log` runs
+# (started by the app lifespan) entries are handed to it through a bounded
+# queue; otherwise they are logged inline.
+_audit_log_sink: dict[str, Any] = {"queue": None, "dropped": 0}
 _maintenance_mode: dict[str, Any] = {
     "enabled": False,
     "message": "",
     "enabled_at": None,
     "enabled_by": "system",
 }
-_rollback_points: list[dict[str, Any]] = []
 
 
-def _record_audit(action: str, details: str, admin_ip: str = "unknown") -> None:
-    """Record an admin action in the audit log."""
+def _next_id() -> str:
+    """Return the next process-unique ID (``<run>-<counter>``)."""
+    return f"{_RUN_ID}-{next(_id_counter):06x}"
+
+
+def _record_audit(
+    action: str,
+    details: str,
+    admin_ip: str = "unknown",
+    timestamp: str | None = None,
+) -> None:
+    """Record an admin action in the audit log.
+
+    Endpoints that already hold the request's ISO timestamp pass it as
+    *timestamp* so the entry matches the response without another clock read.
+    The in-memory log is updated synchronously; emitting the structured log
+    line is deferred to :func:`drain_audit_log` when it is running, dropping
+    the oldest queued line if the queue is full.  Actions in
+    ``_QUIET_AUDIT_ACTIONS`` are not emitted unless
+    ``settings.admin_audit_verbose`` is set.
+    """
     entry = {
-        "id": uuid4().hex[:12],
+        "id": _next_id(),
         "action": action,
         "details": details,
         "admin_ip": admin_ip,
-        "timestamp": datetime.now(UTC).isoformat(),
+        "timestamp": timestamp or datetime.now(UTC).isoformat(),
     }
-    _admin_audit_log.insert(0, entry)
-    # Keep only last 1000 entries
-    if len(_admin_audit_log) > 1000:
-        _admin_audit_log[:] = _admin_audit_log[:1000]
-    logger.info("admin.audit", **entry)
+    _admin_audit_log.appendleft(entry)
+    if action in _QUIET_AUDIT_ACTIONS and not settings.admin_audit_verbose:
+        return
+
+    queue: asyncio.Queue[dict[str, Any]] | None = _audit_log_sink["queue"]
+    if queue is None:
+        logger.info("admin.audit", **entry)
+        return
+    if queue.full():
+        queue.get_nowait()
+        _audit_log_sink["dropped"] += 1
+    queue.put_nowait(entry)
+
+
+async def drain_audit_log() -> None:
+    """Emit queued audit entries to the structured log until cancelled.
+
+    Run as a background task for the lifetime of the app.  The queue is
+    created here so it is bound to the running event loop; on cancellation
+    any remaining entries are flushed and inline logging resumes.
+    """
+    queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=_AUDIT_LOG_QUEUE_SIZE)
+    _audit_log_sink["queue"] = queue
+    try:
+        while True:
+            entry = await queue.get()
+            logger.info("admin.audit", **entry)
+    finally:
+        _audit_log_sink["queue"] = None
+        while not queue.empty():
+            logger.info("admin.audit", **queue.get_nowait())
+        if _audit_log_sink["dropped"]:
+            logger.warning("admin.audit_log_dropped", dropped=_audit_log_sink["dropped"])
+
+
+def _encode_snapshot(data: dict[str, Any]) -> tuple[str, int, bytes]:
+    """Serialise a snapshot's *data* once into ``(checksum, size_bytes, blob)``.
+
+    The payload is encoded as sorted-key orjson one component at a time;
+    each chunk feeds both a rolling SHA-256 and a streaming zlib compressor,
+    so there is a single serialisation pass and peak memory is bounded by
+    the largest component.  ``data["schemes"]`` holds the live scheme list
+    and is encoded by :func:`_encode_schemes`.  The chunks concatenate to exactly
+    ``orjson.dumps(data, option=OPT_SORT_KEYS)``, which is what the
+    checksum covers and what ``blob`` decompresses to.
+    """
+    digest = hashlib.sha256()
+    compressor = zlib.compressobj(_SNAPSHOT_COMPRESSION_LEVEL)
+    blob_parts: list[bytes] = []
+    size_bytes = 0
+
+    def feed(chunk: bytes) -> None:
+        nonlocal size_bytes
+        digest.update(chunk)
+        size_bytes += len(chunk)
+        blob_parts.append(compressor.compress(chunk))
+
+    separator = b"{"
+    for key in sorted(data):
+        feed(separator + orjson.dumps(key) + b":")
+        if key == "schemes":
+            feed(_encode_schemes(data[key]))
+        else:
+            feed(orjson.dumps(data[key], option=_CHECKSUM_OPTIONS, default=str))
+        separator = b","
+    feed(b"}" if data else b"{}")
+    blob_parts.append(compressor.flush())
+    return digest.hexdigest()[:16], size_bytes, b"".join(blob_parts)
+
+
+def _scheme_id_index(state: Any) -> tuple[frozenset[str], Counter[str]]:
+    """Return ``(scheme_ids, id_counts)`` for ``state.scheme_data``.
+
+    ``id_counts`` counts every ID (empty ones under ``""``); ``scheme_ids``
+    holds the non-empty ones.  The result is cached on *state* and keyed
+    on the identity of the ``scheme_data`` list, which is always replaced
+    wholesale (startup, ingest, rollback) rather than mutated in place, so
+    repeated admin calls skip the full pass.  Callers must treat the
+    returned ``Counter`` as read-only.
+    """
+    scheme_data = getattr(state, "scheme_data", [])
+    cached = getattr(state, "scheme_id_index", None)
+    if cached is not None and cached[0] is scheme_data:
+        return cached[1], cached[2]
+    id_counts = Counter(getattr(s, "scheme_id", None) or "" for s in scheme_data)
+    scheme_ids = frozenset(id_counts) - {""}
+    state.scheme_id_index = (scheme_data, scheme_ids, id_counts)
+    return scheme_ids, id_counts
+
+
+def _prune_orphan_verifications(
+    verification_results: dict[str, Any],
+    scheme_ids: frozenset[str],
+) -> int:
+    """Drop verification results whose scheme no longer exists.
+
+    The surviving entries are selected in one comprehension and swapped in
+    with ``clear``/``update`` rather than deleted key by key.  The dict is
+    updated in place because verification endpoints hold references to it
+    across awaits.  Returns the number of entries removed.
+    """
+    kept = {k: v for k, v in verification_results.items() if k in scheme_ids}
+    removed = len(verification_results) - len(kept)
+    if removed:
+        verification_results.clear()
+        verification_results.update(kept)
+    return removed
+
+
+@lru_cache(maxsize=1)
+def _scheme_list_adapter() -> TypeAdapter[Any]:
+    """Build (once) the adapter that dumps a whole scheme list in pydantic-core."""
+    return TypeAdapter(list[SchemeDocument])
+
+
+@lru_cache(maxsize=1)
+def _feedback_map_adapter() -> TypeAdapter[Any]:
+    """Build (once) the adapter that dumps the feedback store."""
+    return TypeAdapter(dict[str, CitizenFeedback])
+
+
+@lru_cache(maxsize=1)
+def _profile_map_adapter() -> TypeAdapter[Any]:
+    """Build (once) the adapter that dumps the profile store."""
+    return TypeAdapter(dict[str, UserProfile])
+
+
+def _encode_schemes(scheme_data: list[Any]) -> bytes:
+    """Return the encoded ``"schemes"`` chunk for *scheme_data*, reusing the last one.
+
+    ``scheme_data`` is replaced wholesale whenever schemes change and its
+    documents are never mutated in place, so consecutive snapshots of the
+    same list can share one set of bytes instead of re-dumping and
+    re-serialising every document.
+    """
+    cached = _scheme_chunk_cache["entry"]
+    if cached is not None and cached[0] is scheme_data:
+        return cached[1]
+    if all(isinstance(s, SchemeDocument) for s in scheme_data):
+        dump = _scheme_list_adapter().dump_python(scheme_data, mode="json")
+    else:
+        dump = [
+            s.model_dump(mode="json") if hasattr(s, "model_dump") else s
+            for s in scheme_data
+        ]
+    chunk = orjson.dumps(dump, option=_CHECKSUM_OPTIONS, default=str)
+    _scheme_chunk_cache["entry"] = (scheme_data, chunk)
+    return chunk
+
+
+def _capture_snapshot_data(
+    scheme_data: list[Any],
+    verification_results: dict[str, Any],
+) -> tuple[dict[str, Any], list[str]]:
+    """Collect the snapshot payload and the list of captured components.
+
+    Model collections are dumped in a single ``TypeAdapter`` call so the
+    per-item loop runs inside pydantic-core.  Live objects such as
+    ``scheme_data`` and ``verification_results`` are referenced without
+    copying: callers
+    serialise the payload with :func:`_encode_snapshot` before yielding
+    to the event loop.
+    """
+    data: dict[str, Any] = {}
+    components: list[str] = []
+
+    if scheme_data:
+        data["schemes"] = scheme_data
+        components.append("schemes")
+
+    if verification_results:
+        data["verification"] = verification_results
+        components.append("verification")
+
+    if _feedback_store:
+        data["feedback"] = _feedback_map_adapter().dump_python(_feedback_store, mode="json")
+        data["feedback_index"] = list(_feedback_index)
+        components.append("feedback")
+
+    if _profiles:
+        if all(isinstance(p, UserProfile) for p in _profiles.values()):
+            data["profiles"] = _profile_map_adapter().dump_python(_profiles, mode="json")
+        else:
+            data["profiles"] = {
+                pid: p.model_dump(mode="json") if hasattr(p, "model_dump") else str(p)
+                for pid, p in _profiles.items()
+            }
+        components.append("profiles")
+
+    return data, components
+
+
+def _snapshot_paths(snapshot_id: str) -> tuple[Path, Path]:
+    """Return the ``(blob, metadata)`` file paths for *snapshot_id*."""
+    directory = Path(settings.admin_snapshot_dir)
+    return directory / f"{snapshot_id}.json.zz", directory / f"{snapshot_id}.meta.json"
+
+
+def _write_snapshot_files(snapshot_id: str, meta: dict[str, Any], blob: bytes) -> Path:
+    """Write a snapshot's blob, then its metadata, to the snapshot dir (blocking).
+
+    Each file is written to a temporary name and renamed into place so a
+    crash never leaves a truncated file.  The metadata is written last:
+    a blob without metadata is treated as an orphan on the next startup.
+    """
+    path, meta_path = _snapshot_paths(snapshot_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for target, content in ((path, blob), (meta_path, orjson.dumps(meta))):
+        tmp_path = target.with_suffix(".tmp")
+        try:
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, target)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    return path
+
+
+def _remove_snapshot_files(paths: list[str]) -> None:
+    """Delete spilled snapshot blobs and their metadata files (blocking)."""
+    for raw in paths:
+        path = Path(raw)
+        path.unlink(missing_ok=True)
+        path.with_name(path.name.removesuffix(".json.zz") + ".meta.json").unlink(missing_ok=True)
+
+
+async def _spill_snapshot(snapshot_id: str, meta: dict[str, Any], blob: bytes) -> Path | None:
+    """Write *blob* and *meta* to ``settings.admin_snapshot_dir``.
+
+    Returns the blob path, or ``None`` when no directory is configured or
+    the write fails, in which case the caller keeps the blob in memory.
+    """
+    if not settings.admin_snapshot_dir:
+        return None
+    try:
+        return await asyncio.to_thread(_write_snapshot_files, snapshot_id, meta, blob)
+    except OSError:
+        logger.warning("admin.snapshot_spill_failed", snapshot_id=snapshot_id, exc_info=True)
+        return None
+
+
+async def _store_snapshot(meta: dict[str, Any], blob: bytes) -> None:
+    """Store a snapshot as the newest rollback point.
+
+    *meta* is the listing metadata (``snapshot_id``, ``created_at``,
+    ``components``, ``checksum``) and *blob* the compressed payload from
+    :func:`_encode_snapshot`; use :func:`_load_snapshot_data` to get the
+    payload back.  When ``settings.admin_snapshot_dir`` is set only the
+    metadata and file path stay in memory.  Beyond ``_MAX_ROLLBACK_POINTS``
+    the oldest snapshot is evicted and its files removed.
+    """
+    snapshot_id = meta["snapshot_id"]
+    path = await _spill_snapshot(snapshot_id, meta, blob)
+    if path is None:
+        _snapshots[snapshot_id] = {"meta": meta, "blob": blob}
+    else:
+        _snapshots[snapshot_id] = {"meta": meta, "path": str(path)}
+    _snapshots.move_to_end(snapshot_id, last=False)
+    evicted_paths: list[str] = []
+    while len(_snapshots) > _MAX_ROLLBACK_POINTS:
+        _, evicted = _snapshots.popitem(last=True)
+        if "path" in evicted:
+            evicted_paths.append(evicted["path"])
+    _invalidate_snapshot_listing()
+    if evicted_paths:
+        await asyncio.to_thread(_remove_snapshot_files, evicted_paths)
+
+
+def _scan_snapshot_dir(directory: Path) -> list[tuple[dict[str, Any], str]]:
+    """Index a snapshot directory left by earlier processes (blocking).
+
+    Returns ``(meta, blob_path)`` for the newest ``_MAX_ROLLBACK_POINTS``
+    complete snapshots, newest first.  Older snapshots, blobs without
+    readable metadata (or the reverse) and leftover temporary files are
+    deleted so the directory stays bounded across restarts.
+    """
+    if not directory.is_dir():
+        return []
+    found: list[tuple[dict[str, Any], str]] = []
+    for meta_path in directory.glob("*.meta.json"):
+        path = meta_path.with_name(meta_path.name.removesuffix(".meta.json") + ".json.zz")
+        try:
+            meta = orjson.loads(meta_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            meta = None
+        if not isinstance(meta, dict) or not path.is_file():
+            meta_path.unlink(missing_ok=True)
+            continue
+        found.append((meta, str(path)))
+    found.sort(key=lambda entry: str(entry[0].get("created_at", "")), reverse=True)
+
+    kept = found[:_MAX_ROLLBACK_POINTS]
+    _remove_snapshot_files([path for _, path in found[_MAX_ROLLBACK_POINTS:]])
+    kept_paths = {path for _, path in kept}
+    for stray in (*directory.glob("*.json.zz"), *directory.glob("*.tmp")):
+        if str(stray) not in kept_paths:
+            stray.unlink(missing_ok=True)
+    return kept
+
+
+async def restore_spilled_snapshots() -> int:
+    """Re-register snapshots spilled to disk by earlier processes.
+
+    Called once from the app lifespan when ``settings.admin_snapshot_dir``
+    is set.  Files beyond the rollback-point cap, and orphans from
+    interrupted writes, are removed.  Returns the number of snapshots
+    restored.
+    """
+    if not settings.admin_snapshot_dir:
+        return 0
+    try:
+        entries = await asyncio.to_thread(_scan_snapshot_dir, Path(settings.admin_snapshot_dir))
+    except OSError:
+        logger.warning("admin.snapshot_restore_failed", exc_info=True)
+        return 0
+
+    restored = 0
+    for meta, path in reversed(entries):
+        snapshot_id = meta.get("snapshot_id")
+        if not snapshot_id or snapshot_id in _snapshots:
+            continue
+        _snapshots[snapshot_id] = {"meta": meta, "path": path}
+        _snapshots.move_to_end(snapshot_id, last=False)
+        restored += 1
+    if restored:
+        _invalidate_snapshot_listing()
+    logger.info("admin.snapshots_restored", count=restored)
+    return restored
+
+
+def _invalidate_snapshot_listing() -> None:
+    """Bump the snapshot version after ``_snapshots`` changes."""
+    _snapshot_listing["version"] += 1
+    _snapshot_listing["body"] = None
+
+
+async def _load_snapshot_data(snapshot: dict[str, Any]) -> dict[str, Any]:
+    """Decompress and parse the ``data`` payload of a stored snapshot."""
+    blob = (
+        await asyncio.to_thread(Path(snapshot["path"]).read_bytes)
+        if "path" in snapshot
+        else snapshot["blob"]
+    )
+    return orjson.loads(zlib.decompress(blob))
 
 
 # ---------------------------------------------------------------------------
@@ -80,6 +491,15 @@ class MaintenanceModeRequest(BaseModel):
     )
 
 
+class SystemStatusResponse(BaseModel):
+    status: str
+    subsystems: dict[str, Any]
+    data_integrity: dict[str, Any]
+    maintenance_mode: dict[str, Any]
+    recommendations: list[str]
+    last_checked: str
+
+
 class SnapshotResponse(BaseModel):
     snapshot_id: str
     created_at: str
@@ -101,32 +521,33 @@ class RollbackRequest(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-@router.get("/status")
-async def get_system_status(request: Request) -> dict[str, Any]:
+@router.get("/status", response_model=SystemStatusResponse)
+async def get_system_status(request: Request) -> SystemStatusResponse:
     """Get comprehensive system status for disaster recovery dashboard.
 
     Returns health of all subsystems, data integrity checks,
     backup status, and recommended actions.
     """
     admin_ip = request.client.host if request.client else "unknown"
-    _record_audit("status_check", "System status requested", admin_ip)
+    now_iso = datetime.now(UTC).isoformat()
+    _record_audit("status_check", "System status requested", admin_ip, now_iso)
 
     # Collect subsystem statuses
     cache = getattr(request.app.state, "cache", None)
     scheme_data = getattr(request.app.state, "scheme_data", [])
     verification_results = getattr(request.app.state, "verification_results", {})
     self_sustaining = getattr(request.app.state, "self_sustaining", None)
-
-    # Import in-memory stores to check their state
-    from src.api.v1.feedback import _feedback_store
-    from src.api.v1.profile import _profiles
+    n_schemes = len(scheme_data)
+    n_verified = len(verification_results)
+    n_profiles = len(_profiles)
+    n_snapshots = len(_snapshots)
 
     subsystems = {
         "api_server": "healthy",
-        "scheme_data": "healthy" if scheme_data else "degraded",
-        "verification_engine": "healthy" if verification_results else "no_data",
+        "scheme_data": "healthy" if n_schemes else "degraded",
+        "verification_engine": "healthy" if n_verified else "no_data",
         "cache": "unknown",
-        "profiles_store": f"{len(_profiles)} profiles loaded",
+        "profiles_store": f"{n_profiles} profiles loaded",
         "feedback_store": f"{len(_feedback_store)} entries",
         "maintenance_mode": _maintenance_mode["enabled"],
         "self_sustaining": "active" if self_sustaining else "inactive",
@@ -145,28 +566,24 @@ async def get_system_status(request: Request) -> dict[str, Any]:
 
     # Data integrity
     integrity = {
-        "schemes_loaded": len(scheme_data),
-        "schemes_verified": len(verification_results),
-        "verification_coverage_pct": (
-            round(len(verification_results) / len(scheme_data) * 100, 1)
-            if scheme_data
-            else 0
-        ),
-        "snapshots_available": len(_snapshots),
-        "rollback_points": len(_rollback_points),
+        "schemes_loaded": n_schemes,
+        "schemes_verified": n_verified,
+        "verification_coverage_pct": round(n_verified / n_schemes * 100, 1) if n_schemes else 0,
+        "snapshots_available": n_snapshots,
+        "rollback_points": n_snapshots,
     }
 
     # Recommendations
     recommendations = []
-    if not scheme_data:
+    if not n_schemes:
         recommendations.append(
             "CRITICAL: No scheme data loaded. Run /admin/ingest to load data."
         )
-    if not _snapshots:
+    if not n_snapshots:
         recommendations.append(
             "WARNING: No snapshots exist. Create a snapshot for disaster recovery."
         )
-    if len(_profiles) > 0 and not _snapshots:
+    if n_profiles and not n_snapshots:
         recommendations.append(
             "WARNING: User profiles exist but no backup. Create a snapshot now."
         )
@@ -177,14 +594,14 @@ async def get_system_status(request: Request) -> dict[str, Any]:
     if not recommendations:
         recommendations.append("All systems operational. No action required.")
 
-    return {
-        "status": "maintenance" if _maintenance_mode["enabled"] else "operational",
-        "subsystems": subsystems,
-        "data_integrity": integrity,
-        "maintenance_mode": _maintenance_mode,
-        "recommendations": recommendations,
-        "last_checked": datetime.now(UTC).isoformat(),
-    }
+    return SystemStatusResponse(
+        status="maintenance" if _maintenance_mode["enabled"] else "operational",
+        subsystems=subsystems,
+        data_integrity=integrity,
+        maintenance_mode=_maintenance_mode,
+        recommendations=recommendations,
+        last_checked=now_iso,
+    )
 
 
 @router.post("/maintenance")
@@ -198,12 +615,11 @@ async def toggle_maintenance_mode(
     non-health endpoints with the configured message.
     """
     admin_ip = request.client.host if request.client else "unknown"
+    now_iso = datetime.now(UTC).isoformat()
 
     _maintenance_mode["enabled"] = body.enabled
     _maintenance_mode["message"] = body.message
-    _maintenance_mode["enabled_at"] = (
-        datetime.now(UTC).isoformat() if body.enabled else None
-    )
+    _maintenance_mode["enabled_at"] = now_iso if body.enabled else None
     _maintenance_mode["enabled_by"] = admin_ip
 
     # Store in app state so middleware can access it
@@ -214,6 +630,7 @@ async def toggle_maintenance_mode(
         f"maintenance_{action}",
         f"Maintenance mode {action}: {body.message[:100]}",
         admin_ip,
+        now_iso,
     )
 
     return {
@@ -235,96 +652,69 @@ async def create_snapshot(request: Request) -> SnapshotResponse:
     scheme_data = getattr(request.app.state, "scheme_data", [])
     verification_results = getattr(request.app.state, "verification_results", {})
 
-    from src.api.v1.feedback import _feedback_index, _feedback_store
-    from src.api.v1.profile import _profiles
-
-    snapshot_id = f"snap-{datetime.now(UTC).strftime('%Y%m%d-%H%M%S')}-{uuid4().hex[:6]}"
-
-    # Deep copy data to prevent mutation
-    snapshot_data: dict[str, Any] = {
-        "snapshot_id": snapshot_id,
-        "created_at": datetime.now(UTC).isoformat(),
-        "components": [],
-        "data": {},
-    }
-
-    # Capture schemes
-    if scheme_data:
-        snapshot_data["data"]["schemes"] = [
-            s.model_dump(mode="json") if hasattr(s, "model_dump") else str(s)
-            for s in scheme_data
-        ]
-        snapshot_data["components"].append("schemes")
-
-    # Capture verification results
-    if verification_results:
-        snapshot_data["data"]["verification"] = copy.deepcopy(verification_results)
-        snapshot_data["components"].append("verification")
-
-    # Capture feedback
-    if _feedback_store:
-        snapshot_data["data"]["feedback"] = {
-            fid: fb.model_dump(mode="json")
-            for fid, fb in _feedback_store.items()
-        }
-        snapshot_data["data"]["feedback_index"] = list(_feedback_index)
-        snapshot_data["components"].append("feedback")
+    # An empty snapshot would still take one of the bounded rollback slots
+    # and could evict a real one.
+    if not (scheme_data or verification_results or _feedback_store or _profiles):
+        raise HTTPException(status_code=400, detail="Nothing to snapshot: all data stores are empty.")
+
+    # One clock read so the ID and ``created_at`` name the same instant.
+    now = datetime.now(UTC)
+    now_iso = now.isoformat()
+    snapshot_id = f"snap-{now.strftime('%Y%m%d-%H%M%S')}-{_next_id()}"
+    data, components = _capture_snapshot_data(scheme_data, verification_results)
+
+    # Serialise once: checksum for integrity verification plus stored blob
+    checksum, size_bytes, blob = _encode_snapshot(data)
+    await _store_snapshot(
+        {
+            "snapshot_id": snapshot_id,
+            "created_at": now_iso,
+            "components": components,
+            "checksum": checksum,
+        },
+        blob,
+    )
 
-    # Capture profiles
-    if _profiles:
-        snapshot_data["data"]["profiles"] = {
-            pid: p.model_dump(mode="json") if hasattr(p, "model_dump") else str(p)
-            for pid, p in _profiles.items()
-        }
-        snapshot_data["components"].append("profiles")
-
-    # Calculate checksum for integrity verification
-    import json
-
-    raw = json.dumps(snapshot_data["data"], sort_keys=True, default=str)
-    checksum = hashlib.sha256(raw.encode()).hexdigest()[:16]
-    snapshot_data["checksum"] = checksum
-
-    # Store snapshot
-    _snapshots[snapshot_id] = snapshot_data
-
-    # Also create a rollback point
-    _rollback_points.insert(0, {
-        "snapshot_id": snapshot_id,
-        "created_at": snapshot_data["created_at"],
-        "components": snapshot_data["components"],
-        "checksum": checksum,
-    })
-    # Keep max 50 rollback points
-    if len(_rollback_points) > 50:
-        oldest_id = _rollback_points.pop()["snapshot_id"]
-        _snapshots.pop(oldest_id, None)
-
-    size_kb = len(raw) / 1024
+    size_kb = size_bytes / 1024
     size_str = f"{size_kb:.1f} KB" if size_kb < 1024 else f"{size_kb / 1024:.1f} MB"
 
     _record_audit(
         "snapshot_created",
-        f"Snapshot {snapshot_id} created ({size_str}, {len(snapshot_data['components'])} components)",
+        f"Snapshot {snapshot_id} created ({size_str}, {len(components)} components)",
         admin_ip,
+        now_iso,
     )
 
     return SnapshotResponse(
         snapshot_id=snapshot_id,
-        created_at=snapshot_data["created_at"],
-        components=snapshot_data["components"],
+        created_at=now_iso,
+        components=components,
         size_estimate=size_str,
         checksum=checksum,
     )
 
 
 @router.get("/snapshots")
-async def list_snapshots() -> dict[str, Any]:
-    """List all available snapshots for rollback."""
-    return {
-        "snapshots": _rollback_points,
-        "total": len(_rollback_points),
-    }
+async def list_snapshots(request: Request) -> Response:
+    """List all available snapshots for rollback.
+
+    The body only changes when a snapshot is created or evicted, so it is
+    serialised once per version and served with a weak ETag; clients that
+    send a matching ``If-None-Match`` get ``304 Not Modified``.
+    """
+    # The run prefix keeps a restarted process from matching stale ETags.
+    etag = f'W/"{_RUN_ID}-{_snapshot_listing["version"]}"'
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    body = _snapshot_listing["body"]
+    if body is None:
+        body = orjson.dumps({
+            "snapshots": [entry["meta"] for entry in _snapshots.values()],
+            "total": len(_snapshots),
+        })
+        _snapshot_listing["body"] = body
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.post("/rollback")
@@ -335,7 +725,9 @@ async def rollback_to_snapshot(
     """Rollback system state to a previous snapshot.
 
     Restores specified components (schemes, feedback, profiles,
-    verification) to the state captured in the snapshot.
+    verification) to the state captured in the snapshot.  Each model
+    collection is validated in one ``TypeAdapter`` call before the live
+    store is touched, so a bad record leaves that store unchanged.
     """
     admin_ip = request.client.host if request.client else "unknown"
 
@@ -346,7 +738,14 @@ async def rollback_to_snapshot(
             detail=f"Snapshot '{body.snapshot_id}' not found.",
         )
 
-    data = snapshot.get("data", {})
+    try:
+        data = await _load_snapshot_data(snapshot)
+    except OSError:
+        logger.error("admin.snapshot_unreadable", snapshot_id=body.snapshot_id, exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Snapshot '{body.snapshot_id}' could not be read.",
+        ) from None
     components_to_restore = body.components
     if "all" in components_to_restore:
         components_to_restore = ["schemes", "verification", "feedback", "profiles"]
@@ -357,44 +756,36 @@ async def rollback_to_snapshot(
     for component in components_to_restore:
         try:
             if component == "schemes" and "schemes" in data:
-                from src.models.scheme import SchemeDocument
-
-                schemes = []
-                for s_data in data["schemes"]:
-                    if isinstance(s_data, dict):
-                        schemes.append(SchemeDocument(**s_data))
+                schemes = _scheme_list_adapter().validate_python(
+                    [s_data for s_data in data["schemes"] if isinstance(s_data, dict)]
+                )
                 request.app.state.scheme_data = schemes
                 restored.append(f"schemes ({len(schemes)} records)")
 
             elif component == "verification" and "verification" in data:
-                request.app.state.verification_results = copy.deepcopy(
-                    data["verification"]
-                )
+                # Freshly decoded from the blob, so already independent.
+                request.app.state.verification_results = data["verification"]
                 restored.append(
                     f"verification ({len(data['verification'])} records)"
                 )
 
             elif component == "feedback" and "feedback" in data:
-                from src.api.v1.feedback import _feedback_index, _feedback_store
-                from src.models.feedback import CitizenFeedback
-
+                feedback = _feedback_map_adapter().validate_python(data["feedback"])
                 _feedback_store.clear()
                 _feedback_index.clear()
-                for fid, fb_data in data["feedback"].items():
-                    _feedback_store[fid] = CitizenFeedback(**fb_data)
+                _feedback_store.update(feedback)
                 _feedback_index.extend(data.get("feedback_index", []))
+                _rebuild_feedback_indexes()
                 restored.append(
                     f"feedback ({len(data['feedback'])} records)"
                 )
 
             elif component == "profiles" and "profiles" in data:
-                from src.api.v1.profile import _profiles
-                from src.models.user_profile import UserProfile
-
+                profiles = _profile_map_adapter().validate_python(
+                    {pid: p_data for pid, p_data in data["profiles"].items() if isinstance(p_data, dict)}
+                )
                 _profiles.clear()
-                for pid, p_data in data["profiles"].items():
-                    if isinstance(p_data, dict):
-                        _profiles[pid] = UserProfile(**p_data)
+                _profiles.update(profiles)
                 restored.append(
                     f"profiles ({len(data['profiles'])} records)"
                 )
@@ -443,22 +834,19 @@ async def flush_cache(request: Request) -> dict[str, Any]:
         # Close and reinitialise the cache
         await cache.close()
 
-        from config.settings import settings
-
-        from src.services.cache import CacheManager
-
         new_cache = CacheManager(
             redis_url=settings.redis_url,
             namespace="haqsetu:",
         )
         request.app.state.cache = new_cache
 
-        _record_audit("cache_flushed", "Cache flushed and rebuilt", admin_ip)
+        now_iso = datetime.now(UTC).isoformat()
+        _record_audit("cache_flushed", "Cache flushed and rebuilt", admin_ip, now_iso)
 
         return {
             "message": "Cache flushed and rebuilt successfully.",
             "flushed": True,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": now_iso,
         }
 
     except Exception as exc:
@@ -481,36 +869,29 @@ async def validate_data_integrity(request: Request) -> dict[str, Any]:
     scheme_data = getattr(request.app.state, "scheme_data", [])
     verification_results = getattr(request.app.state, "verification_results", {})
 
-    from src.api.v1.feedback import _feedback_store
-    from src.api.v1.profile import _profiles
-
     issues: list[str] = []
     warnings: list[str] = []
 
-    # Check scheme data
-    scheme_ids = set()
-    for s in scheme_data:
-        sid = getattr(s, "scheme_id", None) or ""
-        if not sid:
-            issues.append("Found scheme with empty scheme_id")
-        elif sid in scheme_ids:
-            issues.append(f"Duplicate scheme_id: {sid}")
-        scheme_ids.add(sid)
-
-    # Check verification references
-    orphan_verifications = [
-        vid for vid in verification_results if vid not in scheme_ids
-    ]
+    # Check scheme data -- the cached ID counts give both empty and duplicate IDs
+    scheme_ids, id_counts = _scheme_id_index(request.app.state)
+    empty_ids = id_counts.get("", 0)
+    if empty_ids:
+        issues.append(f"Found {empty_ids} scheme(s) with empty scheme_id")
+    issues.extend(
+        f"Duplicate scheme_id: {sid}" for sid, count in id_counts.items() if sid and count > 1
+    )
+
+    # Check verification references (only the count is reported)
+    orphan_verifications = len(verification_results.keys() - scheme_ids)
     if orphan_verifications:
         warnings.append(
-            f"{len(orphan_verifications)} verification results reference non-existent schemes"
+            f"{orphan_verifications} verification results reference non-existent schemes"
         )
 
     # Check feedback references
-    orphan_feedback = 0
-    for fb in _feedback_store.values():
-        if fb.scheme_id and fb.scheme_id not in scheme_ids:
-            orphan_feedback += 1
+    orphan_feedback = sum(
+        1 for fb in _feedback_store.values() if fb.scheme_id and fb.scheme_id not in scheme_ids
+    )
     if orphan_feedback:
         warnings.append(
             f"{orphan_feedback} feedback entries reference non-existent schemes"
@@ -532,10 +913,12 @@ async def validate_data_integrity(request: Request) -> dict[str, Any]:
     elif warnings:
         status = "warnings"
 
+    now_iso = datetime.now(UTC).isoformat()
     _record_audit(
         "data_validation",
         f"Integrity check: {status}, {len(issues)} issues, {len(warnings)} warnings",
         admin_ip,
+        now_iso,
     )
 
     return {
@@ -548,13 +931,15 @@ async def validate_data_integrity(request: Request) -> dict[str, Any]:
             "feedback": len(_feedback_store),
             "profiles": len(_profiles),
         },
-        "checked_at": datetime.now(UTC).isoformat(),
+        "checked_at": now_iso,
     }
 
 
 @router.get("/audit-log")
 async def get_audit_log(
-    limit: int = 50,
+    limit: int = Query(
+        default=50, ge=1, le=_MAX_AUDIT_ENTRIES, description="Maximum entries to return"
+    ),
 ) -> dict[str, Any]:
     """Get the admin action audit log.
 
@@ -562,7 +947,7 @@ async def get_audit_log(
     and forensic analysis.
     """
     return {
-        "entries": _admin_audit_log[:limit],
+        "entries": list(islice(_admin_audit_log, limit)),
         "total": len(_admin_audit_log),
     }
 
@@ -578,26 +963,19 @@ async def auto_fix_issues(request: Request) -> dict[str, Any]:
     """
     admin_ip = request.client.host if request.client else "unknown"
 
-    scheme_data = getattr(request.app.state, "scheme_data", [])
     verification_results = getattr(request.app.state, "verification_results", {})
-    scheme_ids = {
-        getattr(s, "scheme_id", "") for s in scheme_data
-    }
+    scheme_ids, _ = _scheme_id_index(request.app.state)
 
     fixes_applied: list[str] = []
 
     # Fix 1: Remove orphaned verification results
-    orphan_keys = [k for k in verification_results if k not in scheme_ids]
-    for k in orphan_keys:
-        del verification_results[k]
-    if orphan_keys:
+    removed = _prune_orphan_verifications(verification_results, scheme_ids)
+    if removed:
         fixes_applied.append(
-            f"Removed {len(orphan_keys)} orphaned verification results"
+            f"Removed {removed} orphaned verification results"
         )
 
     # Fix 2: Rebuild feedback index
-    from src.api.v1.feedback import _feedback_index, _feedback_store
-
     old_len = len(_feedback_index)
     # Remove index entries that don't exist in store
     valid_ids = [fid for fid in _feedback_index if fid in _feedback_store]
@@ -608,12 +986,13 @@ async def auto_fix_issues(request: Request) -> dict[str, Any]:
             f"Cleaned feedback index: {old_len} -> {len(_feedback_index)} entries"
         )
 
-    # Fix 3: Ensure all feedback store entries are in the index
-    missing_from_index = [
-        fid for fid in _feedback_store if fid not in _feedback_index
-    ]
-    for fid in missing_from_index:
-        _feedback_index.append(fid)
+    # Fix 3: Ensure all feedback store entries are in the index.  Membership
+    # is checked against a set so this stays O(n) instead of O(n^2).
+    indexed = set(valid_ids)
+    missing_from_index = [fid for fid in _feedback_store if fid not in indexed]
+    _feedback_index.extend(missing_from_index)
+    if missing_from_index or len(valid_ids) != old_len:
+        _rebuild_feedback_indexes()
     if missing_from_index:
         fixes_applied.append(
             f"Added {len(missing_from_index)} missing entries to feedback index"
@@ -622,15 +1001,17 @@ async def auto_fix_issues(request: Request) -> dict[str, Any]:
     if not fixes_applied:
         fixes_applied.append("No issues found. System is clean.")
 
+    now_iso = datetime.now(UTC).isoformat()
     _record_audit(
         "auto_fix",
         f"Auto-fix applied: {'; '.join(fixes_applied)}",
         admin_ip,
+        now_iso,
     )
 
     return {
         "fixes_applied": fixes_applied,
-        "timestamp": datetime.now(UTC).isoformat(),
+        "timestamp": now_iso,
     }
 
 
@@ -668,11 +1049,42 @@ class OrchestratorRunRequest(BaseModel):
     )
 
 
-@router.post("/orchestrator/run")
+class FixActionSummary(BaseModel):
+    action_name: str
+    description: str
+    severity: str
+    risk_level: str
+    status: str
+    result: str
+
+
+class OrchestratorRunResponse(BaseModel):
+    report_id: str
+    diagnosis_source: str
+    model_used: str
+    summary: str
+    issues_found: int
+    fixes_executed: int
+    fixes_succeeded: int
+    fixes_failed: int
+    requires_human_approval: bool
+    duration_seconds: float
+    actions: list[FixActionSummary]
+
+
+def _get_orchestrator(request: Request) -> AutoFixOrchestrator:
+    """Retrieve the auto-fix orchestrator from app state, or raise 503."""
+    orchestrator = getattr(request.app.state, "autofix_orchestrator", None)
+    if orchestrator is None:
+        raise HTTPException(status_code=503, detail="Auto-fix orchestrator not available")
+    return orchestrator
+
+
+@router.post("/orchestrator/run", response_model=OrchestratorRunResponse)
 async def run_autofix_orchestrator(
     body: OrchestratorRunRequest,
     request: Request,
-) -> dict[str, Any]:
+) -> OrchestratorRunResponse:
     """Run the AI-powered auto-fix orchestrator.
 
     Uses Gemini 3 Pro (via Vertex AI) to:
@@ -685,20 +1097,7 @@ async def run_autofix_orchestrator(
     """
     admin_ip = request.client.host if request.client else "unknown"
 
-    # Get or create orchestrator
-    orchestrator = getattr(request.app.state, "autofix_orchestrator", None)
-    if orchestrator is None:
-        from config.settings import settings
-        from src.services.autofix_orchestrator import AutoFixOrchestrator
-
-        orchestrator = AutoFixOrchestrator(
-            project_id=settings.gcp_project_id,
-            model_name=settings.vertex_ai_model.replace("flash", "pro")
-            if "flash" in settings.vertex_ai_model
-            else "gemini-3.0-pro",
-            region=settings.vertex_ai_location,
-        )
-        request.app.state.autofix_orchestrator = orchestrator
+    orchestrator = _get_orchestrator(request)
 
     _record_audit(
         "orchestrator_run",
@@ -719,29 +1118,29 @@ async def run_autofix_orchestrator(
         admin_ip,
     )
 
-    return {
-        "report_id": report.report_id,
-        "diagnosis_source": report.diagnosis_source,
-        "model_used": report.model_used,
-        "summary": report.summary,
-        "issues_found": report.issues_found,
-        "fixes_executed": report.fixes_executed,
-        "fixes_succeeded": report.fixes_succeeded,
-        "fixes_failed": report.fixes_failed,
-        "requires_human_approval": report.requires_human_approval,
-        "duration_seconds": report.duration_seconds,
-        "actions": [
-            {
-                "action_name": a.action_name,
-                "description": a.description,
-                "severity": a.severity,
-                "risk_level": a.risk_level,
-                "status": a.status,
-                "result": a.result,
-            }
+    return OrchestratorRunResponse(
+        report_id=report.report_id,
+        diagnosis_source=report.diagnosis_source,
+        model_used=report.model_used,
+        summary=report.summary,
+        issues_found=report.issues_found,
+        fixes_executed=report.fixes_executed,
+        fixes_succeeded=report.fixes_succeeded,
+        fixes_failed=report.fixes_failed,
+        requires_human_approval=report.requires_human_approval,
+        duration_seconds=report.duration_seconds,
+        actions=[
+            FixActionSummary(
+                action_name=a.action_name,
+                description=a.description,
+                severity=a.severity,
+                risk_level=a.risk_level,
+                status=a.status,
+                result=a.result,
+            )
             for a in report.actions
         ],
-    }
+    )
 
 
 @router.get("/orchestrator/history")
@@ -766,19 +1165,7 @@ async def diagnose_only(request: Request) -> dict[str, Any]:
     """
     admin_ip = request.client.host if request.client else "unknown"
 
-    orchestrator = getattr(request.app.state, "autofix_orchestrator", None)
-    if orchestrator is None:
-        from config.settings import settings
-        from src.services.autofix_orchestrator import AutoFixOrchestrator
-
-        orchestrator = AutoFixOrchestrator(
-            project_id=settings.gcp_project_id,
-            model_name=settings.vertex_ai_model.replace("flash", "pro")
-            if "flash" in settings.vertex_ai_model
-            else "gemini-3.0-pro",
-            region=settings.vertex_ai_location,
-        )
-        request.app.state.autofix_orchestrator = orchestrator
+    orchestrator = _get_orchestrator(request)
 
     _record_audit("orchestrator_diagnose", "Diagnosis-only run", admin_ip)
 
@@ -810,14 +1197,11 @@ async def diagnose_only(request: Request) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-def _get_claude_bridge(request: Request):
-    """Get or create the Claude CLI bridge instance."""
+def _get_claude_bridge(request: Request) -> ClaudeCLIBridge:
+    """Retrieve the Claude CLI bridge from app state, or raise 503."""
     bridge = getattr(request.app.state, "claude_cli_bridge", None)
     if bridge is None:
-        from src.services.claude_cli_bridge import ClaudeCLIBridge
-
-        bridge = ClaudeCLIBridge()
-        request.app.state.claude_cli_bridge = bridge
+        raise HTTPException(status_code=503, detail="Claude CLI bridge not available")
     return bridge
 
 
@@ -7,6 +7,9 @@ explanations in their preferred language.
 
 from __future__ import annotations
 
+from operator import attrgetter
+from typing import Final
+
 import structlog
 from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
 
@@ -14,6 +17,15 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/document", tags=["document-scanner"])
 
+_MAX_IMAGE_BYTES: Final[int] = 10 * 1024 * 1024  # 10 MB
+_READ_CHUNK_BYTES: Final[int] = 256 * 1024
+
+# Action-item fields returned to the client, read in one attrgetter call.
+# The service module is not imported here (it pulls in the Vision client),
+# so items are projected by attribute rather than via a TypeAdapter.
+_ACTION_ITEM_KEYS: Final[tuple[str, ...]] = ("description", "deadline", "priority", "contact_info")
+_action_item_fields = attrgetter(*_ACTION_ITEM_KEYS)
+
 
 @router.post("/scan")
 async def scan_document(
@@ -37,17 +49,19 @@ async def scan_document(
     if scanner is None:
         raise HTTPException(status_code=503, detail="Document scanner not available")
 
-    # Read image with size limit
-    max_size = 10 * 1024 * 1024  # 10 MB
-    size = 0
-    chunks: list[bytes] = []
+    # Reject oversized uploads up front when the multipart parser already
+    # knows the size; otherwise enforce the limit while reading.
+    if image.size is not None and image.size > _MAX_IMAGE_BYTES:
+        raise HTTPException(status_code=413, detail="Image too large. Maximum 10 MB.")
+
+    # Read into one growable buffer rather than a list of chunks plus a join
+    buf = bytearray()
     try:
-        while chunk := await image.read(64 * 1024):
-            size += len(chunk)
-            if size > max_size:
+        while chunk := await image.read(_READ_CHUNK_BYTES):
+            if len(buf) + len(chunk) > _MAX_IMAGE_BYTES:
                 raise HTTPException(status_code=413, detail="Image too large. Maximum 10 MB.")
-            chunks.append(chunk)
-        image_data = b"".join(chunks)
+            buf += chunk
+        image_data = bytes(buf)
     except HTTPException:
         raise
     except Exception:
@@ -67,12 +81,7 @@ async def scan_document(
         "summary": explanation.summary,
         "plain_language_summary": explanation.plain_language_summary,
         "action_items": [
-            {
-                "description": item.description,
-                "deadline": item.deadline,
-                "priority": item.priority,
-                "contact_info": item.contact_info,
-            }
+            dict(zip(_ACTION_ITEM_KEYS, _action_item_fields(item), strict=True))
             for item in explanation.action_items
         ],
         "referenced_laws": explanation.referenced_laws,
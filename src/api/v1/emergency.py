@@ -7,14 +7,36 @@ safety guidance.
 
 from __future__ import annotations
 
+from typing import Any, Final
+
 import structlog
 from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, computed_field
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/emergency", tags=["emergency-sos"])
 
+# Static fallbacks for /report, built once and returned as-is (responses are
+# only serialised, never mutated).  The first three numbers are the core set
+# used when the SOS service fails mid-request.
+_FALLBACK_NUMBERS: Final[tuple[dict[str, str], ...]] = (
+    {"name": "Universal Emergency", "number": "112"},
+    {"name": "Police", "number": "100"},
+    {"name": "Women Helpline", "number": "181"},
+    {"name": "Child Helpline", "number": "1098"},
+    {"name": "Ambulance", "number": "108"},
+)
+_FALLBACK_MESSAGE: Final[str] = "Call 112 for immediate emergency assistance."
+_SERVICE_UNAVAILABLE_RESPONSE: Final[dict[str, Any]] = {
+    "emergency_numbers": list(_FALLBACK_NUMBERS),
+    "message": _FALLBACK_MESSAGE,
+}
+_REPORT_FAILED_RESPONSE: Final[dict[str, Any]] = {
+    "emergency_numbers": list(_FALLBACK_NUMBERS[:3]),
+    "message": _FALLBACK_MESSAGE,
+}
+
 
 class EmergencyReportRequest(BaseModel):
     description: str = Field(
@@ -36,6 +58,36 @@ class SafetyPlanRequest(BaseModel):
     language: str = Field(default="hi")
 
 
+class EmergencyContactOut(BaseModel):
+    """Public view of a helpline, read from the service's contact objects."""
+
+    model_config = {"from_attributes": True}
+
+    name: str
+    number: str
+    description: str
+
+
+class EmergencyContactDetailOut(EmergencyContactOut):
+    """Helpline view for the contacts directory, with round-the-clock flag."""
+
+    available: str = Field(default="24x7", exclude=True)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def available_24x7(self) -> bool:
+        return self.available.startswith("24x7")
+
+
+# Validate service contact lists straight from attributes in one call.
+_CONTACTS_ADAPTER: Final[TypeAdapter[list[EmergencyContactOut]]] = TypeAdapter(
+    list[EmergencyContactOut]
+)
+_CONTACT_DETAILS_ADAPTER: Final[TypeAdapter[list[EmergencyContactDetailOut]]] = TypeAdapter(
+    list[EmergencyContactDetailOut]
+)
+
+
 @router.post("/report")
 async def report_emergency(
     body: EmergencyReportRequest, request: Request
@@ -50,43 +102,28 @@ async def report_emergency(
     sos_service = getattr(request.app.state, "emergency_sos", None)
     if sos_service is None:
         # Even if service is down, return basic emergency info
-        return {
-            "emergency_numbers": [
-                {"name": "Universal Emergency", "number": "112"},
-                {"name": "Police", "number": "100"},
-                {"name": "Women Helpline", "number": "181"},
-                {"name": "Child Helpline", "number": "1098"},
-                {"name": "Ambulance", "number": "108"},
-            ],
-            "message": "Call 112 for immediate emergency assistance.",
-        }
+        return _SERVICE_UNAVAILABLE_RESPONSE
 
     try:
-        response = await sos_service.report_emergency(
+        response = sos_service.report_emergency(
             description=body.description,
             location=body.location,
             language=body.language,
         )
     except Exception:
         logger.error("api.emergency.report_failed", exc_info=True)
-        return {
-            "emergency_numbers": [
-                {"name": "Universal Emergency", "number": "112"},
-                {"name": "Police", "number": "100"},
-                {"name": "Women Helpline", "number": "181"},
-            ],
-            "message": "Call 112 for immediate emergency assistance.",
-        }
+        return _REPORT_FAILED_RESPONSE
 
     return {
         "emergency_type": response.emergency_type,
         "severity": response.severity,
-        "immediate_action": response.immediate_action,
-        "emergency_contacts": [
-            {"name": c.name, "number": c.number, "description": c.description}
-            for c in response.contacts
-        ],
-        "safety_tips": response.safety_tips,
+        "immediate_action": (
+            f"Call {response.primary_helpline.name} at {response.primary_helpline.number}"
+        ),
+        "emergency_contacts": _CONTACTS_ADAPTER.validate_python(
+            response.all_contacts, from_attributes=True
+        ),
+        "safety_tips": response.safety_plan.immediate_steps,
         "report_id": response.report_id,
         "message": "If you are in immediate danger, call 112 NOW.",
     }
@@ -112,15 +149,7 @@ async def get_emergency_contacts(
     return {
         "emergency_type": emergency_type,
         "state": state,
-        "contacts": [
-            {
-                "name": c.name,
-                "number": c.number,
-                "description": c.description,
-                "available_24x7": c.available_24x7,
-            }
-            for c in contacts
-        ],
+        "contacts": _CONTACT_DETAILS_ADAPTER.validate_python(contacts, from_attributes=True),
     }
 
 
@@ -141,17 +170,19 @@ async def generate_safety_plan(
         raise HTTPException(status_code=503, detail="Emergency SOS service not available")
 
     try:
-        plan = await sos_service.generate_safety_plan(body.situation)
+        plan = sos_service.generate_safety_plan(body.situation)
     except Exception:
         logger.error("api.emergency.safety_plan_failed", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to generate safety plan") from None
 
     return {
-        "situation_type": plan.situation_type,
+        "situation_type": plan.emergency_type,
         "immediate_steps": plan.immediate_steps,
-        "medium_term_steps": plan.medium_term_steps,
-        "resources": plan.resources,
-        "legal_protections": plan.legal_protections,
-        "helplines": plan.helplines,
+        "medium_term_steps": plan.documentation_steps + plan.legal_steps,
+        "resources": plan.shelter_info,
+        "legal_protections": plan.key_laws,
+        "helplines": _CONTACTS_ADAPTER.validate_python(
+            plan.helpline_numbers, from_attributes=True
+        ),
         "important": "If you are in immediate danger, call 112.",
     }
@@ -10,12 +10,15 @@ re-verification of the affected scheme data.
 
 from __future__ import annotations
 
+from collections import Counter, defaultdict, deque
 from datetime import UTC, datetime
-from typing import Any
+from itertools import count
+from typing import TYPE_CHECKING, Any, Final
+from urllib.parse import urlparse
 from uuid import uuid4
 
 import structlog
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
 from pydantic import BaseModel, Field
 
 from src.models.feedback import (
@@ -27,6 +30,9 @@ from src.models.feedback import (
     FeedbackType,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/feedback", tags=["feedback"])
@@ -37,7 +43,169 @@ router = APIRouter(prefix="/feedback", tags=["feedback"])
 # ---------------------------------------------------------------------------
 
 _feedback_store: dict[str, CitizenFeedback] = {}
-_feedback_index: list[str] = []
+# Feedback IDs, newest first; a deque so each submission is an O(1) appendleft.
+_feedback_index: deque[str] = deque()
+
+# Running aggregates over ``_feedback_store`` so ``/feedback/stats`` does not
+# rescan the store.  Kept in step by :func:`_track_feedback` and
+# :func:`_set_feedback_status`; code that replaces the store wholesale calls
+# :func:`_rebuild_feedback_indexes`.
+_status_counts: Counter[str] = Counter()
+_type_counts: Counter[str] = Counter()
+# Sum of ``submitted_at`` POSIX timestamps over resolved feedback, so the mean
+# time since submission is ``now - sum / count`` without a scan.
+_resolved_submitted_ts: dict[str, float] = {"sum": 0.0}
+
+# Valid enum values, checked by set membership; the text is shared by the
+# 400 error details.
+_FEEDBACK_TYPES: Final[frozenset[str]] = frozenset(t.value for t in FeedbackType)
+_FEEDBACK_STATUSES: Final[frozenset[str]] = frozenset(s.value for s in FeedbackStatus)
+_VALID_TYPES_TEXT: Final[str] = str([t.value for t in FeedbackType])
+_VALID_STATUSES_TEXT: Final[str] = str([s.value for s in FeedbackStatus])
+
+_PENDING_STATUSES: Final[tuple[str, ...]] = (FeedbackStatus.SUBMITTED, FeedbackStatus.UNDER_REVIEW)
+
+# Secondary indexes for ``list_feedback``: filter value -> feedback IDs in
+# submission order (oldest first).  Each ID appears at most once per index.
+# An entry may go stale (auto-fix clears orphaned scheme references in place),
+# which is harmless because ``list_feedback`` re-checks every filter.
+_by_type: defaultdict[str, list[str]] = defaultdict(list)
+_by_scheme: defaultdict[str, list[str]] = defaultdict(list)
+# Status buckets change on every triage step, so they are insertion-ordered
+# dicts (O(1) delete and append).  A status change appends out of submission
+# order; such buckets are listed in ``_unsorted_statuses`` and re-sorted by
+# :func:`_status_bucket` the next time a listing reads them.
+_by_status: defaultdict[str, dict[str, None]] = defaultdict(dict)
+_unsorted_statuses: set[str] = set()
+# Feedback ID -> submission sequence number, the sort key of the indexes.
+_feedback_seq: dict[str, int] = {}
+_seq_counter = count()
+
+# Official government hosts accepted as evidence: any subdomain of .gov.in
+# or .nic.in (which covers .india.gov.in), plus a few exact hostnames.
+_GOV_HOST_SUFFIXES: Final[tuple[str, ...]] = (".gov.in", ".nic.in")
+_GOV_EXACT_HOSTS: Final[frozenset[str]] = frozenset({"sansad.in"})
+
+
+# ---------------------------------------------------------------------------
+# Aggregate and index maintenance
+# ---------------------------------------------------------------------------
+
+
+def _track_feedback(feedback: CitizenFeedback, sign: int = 1) -> None:
+    """Add (``sign=1``) or remove (``sign=-1``) *feedback* from the aggregates."""
+    _status_counts[feedback.status] += sign
+    _type_counts[feedback.feedback_type] += sign
+    if feedback.status == FeedbackStatus.RESOLVED:
+        _resolved_submitted_ts["sum"] += sign * feedback.submitted_at.timestamp()
+
+
+def _append_to_indexes(feedback: CitizenFeedback) -> None:
+    """Append *feedback* as the newest entry of each filter index."""
+    fid = feedback.feedback_id
+    _feedback_seq[fid] = next(_seq_counter)
+    _by_type[feedback.feedback_type].append(fid)
+    if feedback.scheme_id:
+        _by_scheme[feedback.scheme_id].append(fid)
+    _by_status[feedback.status][fid] = None
+
+
+def _index_feedback(feedback: CitizenFeedback) -> None:
+    """Add newly stored *feedback* to the aggregates and filter indexes."""
+    _append_to_indexes(feedback)
+    _track_feedback(feedback)
+
+
+def _set_feedback_status(feedback: CitizenFeedback, status: str) -> None:
+    """Change the status of stored *feedback*, keeping aggregates and indexes in step."""
+    if status == feedback.status:
+        return
+    fid = feedback.feedback_id
+    _track_feedback(feedback, -1)
+    old_bucket = _by_status.get(feedback.status)
+    if old_bucket is not None:
+        old_bucket.pop(fid, None)
+    feedback.status = status
+    _track_feedback(feedback)
+    seq = _feedback_seq.get(fid)
+    if seq is not None:
+        bucket = _by_status[status]
+        if bucket and _feedback_seq[next(reversed(bucket))] > seq:
+            _unsorted_statuses.add(status)
+        bucket[fid] = None
+
+
+def _status_bucket(status: str) -> dict[str, None]:
+    """Return the status index bucket for *status* in submission order."""
+    bucket = _by_status.get(status)
+    if bucket is None:
+        return {}
+    if status in _unsorted_statuses:
+        _unsorted_statuses.discard(status)
+        bucket = _by_status[status] = dict.fromkeys(sorted(bucket, key=_feedback_seq.__getitem__))
+    return bucket
+
+
+def _rebuild_feedback_indexes() -> None:
+    """Recompute aggregates and indexes after ``_feedback_store`` is replaced.
+
+    Indexes are stored oldest first, in the reverse of ``_feedback_index``
+    (which is newest first), and only feedback in ``_feedback_index`` is
+    indexed, matching a scan of it.
+    """
+    _status_counts.clear()
+    _type_counts.clear()
+    _resolved_submitted_ts["sum"] = 0.0
+    for index in (_by_type, _by_scheme, _by_status):
+        index.clear()
+    _unsorted_statuses.clear()
+    _feedback_seq.clear()
+    for feedback in _feedback_store.values():
+        _track_feedback(feedback)
+    for fid in reversed(_feedback_index):
+        feedback = _feedback_store.get(fid)
+        if feedback is not None and fid not in _feedback_seq:
+            _append_to_indexes(feedback)
+
+
+def _feedback_json(feedback: CitizenFeedback) -> bytes:
+    """Serialise *feedback* to JSON bytes in one pydantic-core pass."""
+    return feedback.__pydantic_serializer__.to_json(feedback)
+
+
+async def _persist_feedback(cache: Any, feedback_id: str, blob: bytes, index: list[str]) -> None:
+    """Write a submission and the feedback index to the cache.
+
+    Runs as a background task after the 201 has been sent, so a slow or
+    unreachable cache never delays the citizen's response.
+    """
+    try:
+        await cache.set_raw(f"feedback:{feedback_id}", blob, ttl_seconds=86400 * 30)  # 30 days
+        await cache.set("feedback:index", index)
+    except Exception:
+        logger.warning("api.feedback.cache_write_failed", feedback_id=feedback_id, exc_info=True)
+
+
+def _candidate_ids(
+    feedback_type: str | None,
+    scheme_id: str | None,
+    status: str | None,
+) -> Iterable[str]:
+    """Return feedback IDs to scan for a listing, newest first.
+
+    Picks the smallest index among the requested filters; with no filters
+    this is ``_feedback_index`` itself.
+    """
+    buckets: list[list[str] | dict[str, None]] = [
+        index.get(value, [])
+        for index, value in ((_by_type, feedback_type), (_by_scheme, scheme_id))
+        if value is not None
+    ]
+    if status is not None:
+        buckets.append(_status_bucket(status))
+    if not buckets:
+        return _feedback_index
+    return reversed(min(buckets, key=len))
 
 
 # ---------------------------------------------------------------------------
@@ -53,25 +221,12 @@ def _validate_gov_url(url: str | None) -> str | None:
     """
     if url is None or url.strip() == "":
         return None
-    import re
-    from urllib.parse import urlparse
-
     url = url.strip()
     parsed = urlparse(url)
     if parsed.scheme not in ("http", "https"):
         return None
     host = (parsed.hostname or "").lower()
-    gov_patterns = [
-        r"\.gov\.in$",
-        r"\.nic\.in$",
-        r"\.india\.gov\.in$",
-        r"^sansad\.in$",
-        r"^indiacode\.nic\.in$",
-        r"^egazette\.gov\.in$",
-        r"^myscheme\.gov\.in$",
-        r"^data\.gov\.in$",
-    ]
-    if any(re.search(pat, host) for pat in gov_patterns):
+    if host in _GOV_EXACT_HOSTS or host.endswith(_GOV_HOST_SUFFIXES):
         return url
     return None
 
@@ -103,6 +258,7 @@ class SubmitFeedbackRequest(BaseModel):
 async def submit_feedback(
     body: SubmitFeedbackRequest,
     request: Request,
+    background_tasks: BackgroundTasks,
 ) -> FeedbackResponse:
     """Submit new citizen feedback or grievance.
 
@@ -114,14 +270,12 @@ async def submit_feedback(
     the affected scheme is automatically flagged for re-verification.
     """
     # Validate feedback type
-    try:
-        FeedbackType(body.feedback_type)
-    except ValueError:
+    if body.feedback_type not in _FEEDBACK_TYPES:
         raise HTTPException(
             status_code=400,
             detail=(
                 f"Invalid feedback_type '{body.feedback_type}'. "
-                f"Valid types: {[t.value for t in FeedbackType]}"
+                f"Valid types: {_VALID_TYPES_TEXT}"
             ),
         )
 
@@ -161,20 +315,20 @@ async def submit_feedback(
 
     # Store in memory
     _feedback_store[feedback.feedback_id] = feedback
-    _feedback_index.insert(0, feedback.feedback_id)
+    _feedback_index.appendleft(feedback.feedback_id)
+    _index_feedback(feedback)
 
-    # Persist to cache if available
+    # Persist to cache if available, after the response is sent.  The
+    # blob and index are snapshotted now so the task writes this state.
     cache = getattr(request.app.state, "cache", None)
     if cache is not None:
-        try:
-            await cache.set(
-                f"feedback:{feedback.feedback_id}",
-                feedback.model_dump(mode="json"),
-                ttl_seconds=86400 * 30,  # 30 days
-            )
-            await cache.set("feedback:index", _feedback_index)
-        except Exception:
-            logger.warning("api.feedback.cache_write_failed", exc_info=True)
+        background_tasks.add_task(
+            _persist_feedback,
+            cache,
+            feedback.feedback_id,
+            _feedback_json(feedback),
+            list(_feedback_index),
+        )
 
     logger.info(
         "api.feedback.submitted",
@@ -204,35 +358,18 @@ async def get_feedback_stats(
     Returns aggregate counts of feedback by type and status,
     useful for transparency and accountability.
     """
-    all_feedback = list(_feedback_store.values())
+    total = len(_feedback_store)
+    pending = sum(_status_counts[status] for status in _PENDING_STATUSES)
+    resolved = _status_counts[FeedbackStatus.RESOLVED]
+    accuracy_reports = _type_counts[FeedbackType.ACCURACY_REPORT]
+    grievances = _type_counts[FeedbackType.GRIEVANCE]
 
-    total = len(all_feedback)
-    pending = sum(
-        1 for f in all_feedback
-        if f.status in (FeedbackStatus.SUBMITTED, FeedbackStatus.UNDER_REVIEW)
-    )
-    resolved = sum(1 for f in all_feedback if f.status == FeedbackStatus.RESOLVED)
-    accuracy_reports = sum(
-        1 for f in all_feedback
-        if f.feedback_type == FeedbackType.ACCURACY_REPORT
-    )
-    grievances = sum(
-        1 for f in all_feedback
-        if f.feedback_type == FeedbackType.GRIEVANCE
-    )
-
-    # Calculate average resolution time for resolved feedback
+    # Average time since submission for resolved feedback
     avg_resolution: float | None = None
-    resolved_feedback = [f for f in all_feedback if f.status == FeedbackStatus.RESOLVED]
-    if resolved_feedback:
-        total_hours = 0.0
-        count = 0
-        now = datetime.now(UTC)
-        for f in resolved_feedback:
-            delta = now - f.submitted_at
-            total_hours += delta.total_seconds() / 3600
-            count += 1
-        avg_resolution = round(total_hours / count, 2) if count > 0 else None
+    if resolved:
+        now_ts = datetime.now(UTC).timestamp()
+        mean_age_seconds = now_ts - _resolved_submitted_ts["sum"] / resolved
+        avg_resolution = round(mean_age_seconds / 3600, 2)
 
     logger.info(
         "api.feedback.stats_requested",
@@ -268,9 +405,9 @@ async def get_feedback(
         cache = getattr(request.app.state, "cache", None)
         if cache is not None:
             try:
-                cached = await cache.get(f"feedback:{feedback_id}")
+                cached = await cache.get_raw(f"feedback:{feedback_id}")
                 if cached is not None:
-                    feedback = CitizenFeedback(**cached)
+                    feedback = CitizenFeedback.model_validate_json(cached)
             except Exception:
                 logger.warning("api.feedback.cache_read_failed", exc_info=True)
 
@@ -305,41 +442,45 @@ async def list_feedback(
     status: str | None = Query(default=None, description="Filter by status"),
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=20, ge=1, le=100, description="Results per page"),
+    include_total: bool = Query(
+        default=True,
+        description="Count all matches; when false the scan stops after the page and total is null",
+    ),
 ) -> FeedbackListResponse:
     """List feedback with optional filters.
 
     Supports filtering by feedback type, scheme ID, and status.
     Results are sorted by submission date descending (most recent first).
+    Only the requested page is materialised; pass ``include_total=false``
+    to also skip counting the matches beyond it.
     """
     # Validate feedback_type filter if provided
-    if feedback_type is not None:
-        try:
-            FeedbackType(feedback_type)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=(
-                    f"Invalid feedback_type '{feedback_type}'. "
-                    f"Valid types: {[t.value for t in FeedbackType]}"
-                ),
-            )
+    if feedback_type is not None and feedback_type not in _FEEDBACK_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Invalid feedback_type '{feedback_type}'. "
+                f"Valid types: {_VALID_TYPES_TEXT}"
+            ),
+        )
 
     # Validate status filter if provided
-    if status is not None:
-        try:
-            FeedbackStatus(status)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=(
-                    f"Invalid status '{status}'. "
-                    f"Valid statuses: {[s.value for s in FeedbackStatus]}"
-                ),
-            )
+    if status is not None and status not in _FEEDBACK_STATUSES:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Invalid status '{status}'. "
+                f"Valid statuses: {_VALID_STATUSES_TEXT}"
+            ),
+        )
 
-    # Build filtered list from index (already sorted by submitted_at descending)
-    filtered: list[CitizenFeedback] = []
-    for fid in _feedback_index:
+    # Scan the narrowest index for the filters (newest first); every filter
+    # is still checked per item.  Only the page window is kept.
+    start = (page - 1) * page_size
+    end = start + page_size
+    page_feedback: list[CitizenFeedback] = []
+    matched = 0
+    for fid in _candidate_ids(feedback_type, scheme_id, status):
         fb = _feedback_store.get(fid)
         if fb is None:
             continue
@@ -351,14 +492,13 @@ async def list_feedback(
         if status is not None and fb.status != status:
             continue
 
-        filtered.append(fb)
+        if start <= matched < end:
+            page_feedback.append(fb)
+        matched += 1
+        if matched >= end and not include_total:
+            break
 
-    total = len(filtered)
-
-    # Paginate
-    start = (page - 1) * page_size
-    end = start + page_size
-    page_feedback = filtered[start:end]
+    total = matched if include_total else None
 
     feedbacks_out = [
         {
@@ -403,15 +543,15 @@ async def trigger_reverification(
         )
 
     feedback.triggered_reverification = True
-    feedback.status = FeedbackStatus.UNDER_REVIEW
+    _set_feedback_status(feedback, FeedbackStatus.UNDER_REVIEW)
 
     # Persist updated feedback to cache
     cache = getattr(request.app.state, "cache", None)
     if cache is not None:
         try:
-            await cache.set(
+            await cache.set_raw(
                 f"feedback:{feedback.feedback_id}",
-                feedback.model_dump(mode="json"),
+                _feedback_json(feedback),
                 ttl_seconds=86400 * 30,
             )
         except Exception:
@@ -10,6 +10,8 @@ import structlog
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel, Field
 
+from src.services.grievance_tracker import GrievanceRequest
+
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/grievance", tags=["grievance-tracker"])
@@ -42,7 +44,6 @@ async def create_grievance(
         raise HTTPException(status_code=503, detail="Grievance tracker not available")
 
     try:
-        from src.services.grievance_tracker import GrievanceRequest
         greq = GrievanceRequest(
             complainant_name=body.complainant_name,
             description=body.description,
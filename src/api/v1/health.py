@@ -7,7 +7,9 @@ GCP services.
 
 from __future__ import annotations
 
+import asyncio
 import time
+from typing import Any
 
 import structlog
 from fastapi import APIRouter, Request
@@ -38,6 +40,37 @@ class ReadinessResponse(BaseModel):
     checks: dict[str, str]
 
 
+# ---------------------------------------------------------------------------
+# Readiness checks
+# ---------------------------------------------------------------------------
+
+
+async def _check_cache(cache: Any) -> tuple[str, bool]:
+    """Return the cache check status and whether it passed."""
+    if cache is None:
+        return "not_configured", True
+    try:
+        ok = await cache.ping()
+    except Exception as exc:
+        return f"error: {exc!s}", False
+    if ok:
+        return "ok", True
+    return "degraded", False
+
+
+async def _check_translation(translation: Any) -> tuple[str, bool]:
+    """Return the translation check status and whether it passed."""
+    if translation is None:
+        return "not_configured", True
+    try:
+        lang, conf = await translation.detect_language("hello")
+    except Exception as exc:
+        return f"error: {exc!s}", False
+    if lang and conf > 0:
+        return "ok", True
+    return "degraded", False
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -50,8 +83,9 @@ async def health_check(request: Request) -> HealthResponse:
     Returns 200 if the application process is running and able to
     handle requests.  Does *not* check downstream dependencies.
     """
-    start_time: float = getattr(request.app.state, "start_time", time.time())
-    uptime = time.time() - start_time
+    # ``start_time`` is a ``time.monotonic()`` reading taken at startup.
+    start_time: float | None = getattr(request.app.state, "start_time", None)
+    uptime = time.monotonic() - start_time if start_time is not None else 0.0
 
     return HealthResponse(
         status="healthy",
@@ -71,41 +105,18 @@ async def readiness_check(request: Request) -> ReadinessResponse:
     checks: dict[str, str] = {}
     all_ok = True
 
-    # -- Check cache connectivity ------------------------------------------
-    cache = getattr(request.app.state, "cache", None)
-    if cache is not None:
-        try:
-            await cache.set("_health_check", "ok", ttl_seconds=10)
-            val = await cache.get("_health_check")
-            if val == "ok":
-                checks["cache"] = "ok"
-            else:
-                checks["cache"] = "degraded"
-                all_ok = False
-        except Exception as exc:
-            checks["cache"] = f"error: {exc!s}"
-            all_ok = False
-    else:
-        checks["cache"] = "not_configured"
-
-    # -- Check translation service -----------------------------------------
-    translation = getattr(request.app.state, "translation", None)
-    if translation is not None:
-        try:
-            lang, conf = await translation.detect_language("hello")
-            if lang and conf > 0:
-                checks["translation"] = "ok"
-            else:
-                checks["translation"] = "degraded"
-                all_ok = False
-        except Exception as exc:
-            checks["translation"] = f"error: {exc!s}"
-            all_ok = False
-    else:
-        checks["translation"] = "not_configured"
+    # -- Check cache and translation concurrently --------------------------
+    state = request.app.state
+    results = await asyncio.gather(
+        _check_cache(getattr(state, "cache", None)),
+        _check_translation(getattr(state, "translation", None)),
+    )
+    for name, (check_status, ok) in zip(("cache", "translation"), results, strict=True):
+        checks[name] = check_status
+        all_ok = all_ok and ok
 
     # -- Check scheme data loaded ------------------------------------------
-    scheme_data = getattr(request.app.state, "scheme_data", None)
+    scheme_data = getattr(state, "scheme_data", None)
     if scheme_data is not None and len(scheme_data) > 0:
         checks["scheme_data"] = f"ok ({len(scheme_data)} schemes loaded)"
     else:
@@ -113,7 +124,7 @@ async def readiness_check(request: Request) -> ReadinessResponse:
         all_ok = False
 
     # -- Check orchestrator ------------------------------------------------
-    orchestrator = getattr(request.app.state, "orchestrator", None)
+    orchestrator = getattr(state, "orchestrator", None)
     if orchestrator is not None:
         checks["orchestrator"] = "ok"
     else:
@@ -5,14 +5,21 @@ ingestion pipeline.  All endpoints require admin-level access.
 
 Endpoints
 ---------
-- ``POST /api/v1/admin/ingest``          -- Trigger a full ingestion run.
-- ``POST /api/v1/admin/ingest/incremental`` -- Trigger an incremental update.
-- ``GET  /api/v1/admin/ingest/status``   -- Get the last ingestion result.
+- ``POST /api/v1/admin/ingest``          -- Start a full ingestion run.
+- ``POST /api/v1/admin/ingest/incremental`` -- Start an incremental update.
+- ``GET  /api/v1/admin/ingest/status``   -- Poll the running job and last result.
+
+Runs execute as background tasks: the POST endpoints return ``202`` with
+a job ID straight away, and only one run (full or incremental) is active
+at a time.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Request
@@ -20,6 +27,9 @@ from pydantic import BaseModel
 
 from src.middleware.auth import require_admin_api_key
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
 router = APIRouter(
@@ -46,6 +56,8 @@ class IngestionStatusResponse(BaseModel):
     """Response for the ingestion status endpoint."""
 
     status: str
+    running_job_id: str | None = None
+    last_job: dict[str, Any] | None = None
     last_result: dict[str, Any] | None = None
     scheduler_running: bool = False
     last_full_run: str | None = None
@@ -73,16 +85,88 @@ def _get_scheduler(request: Request):
     return getattr(request.app.state, "scheduler", None)
 
 
+def _job_summary(job: dict[str, Any]) -> dict[str, Any]:
+    """Describe an ingestion job record without its task handle."""
+    task: asyncio.Task = job["task"]
+    summary = {k: v for k, v in job.items() if k != "task"}
+    if not task.done():
+        summary["status"] = "running"
+    elif task.cancelled():
+        summary["status"] = "cancelled"
+    elif task.exception() is not None:
+        summary["status"] = "failed"
+    else:
+        summary["status"] = "completed"
+    return summary
+
+
+def _on_job_done(job: dict[str, Any], task: asyncio.Task) -> None:
+    """Log the outcome of a finished ingestion task."""
+    kind = job["kind"]
+    if task.cancelled():
+        logger.warning(f"api.admin.ingest.{kind}_cancelled", job_id=job["job_id"])
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error(f"api.admin.ingest.{kind}_failed", job_id=job["job_id"], exc_info=exc)
+        return
+    result = task.result()
+    logger.info(
+        f"api.admin.ingest.{kind}_completed",
+        job_id=job["job_id"],
+        total_fetched=result.total_fetched,
+        new_schemes=result.new_schemes,
+        updated_schemes=result.updated_schemes,
+        failed_schemes=result.failed_schemes,
+        duration_seconds=round(result.duration_seconds, 1),
+    )
+
+
+def _start_job(
+    request: Request, kind: str, run: Callable[[], Awaitable[Any]]
+) -> IngestionTriggerResponse:
+    """Start *run* as the ingestion job unless one is already running.
+
+    The job record is kept on ``app.state.ingest_job`` so the task stays
+    referenced until it finishes and ``/status`` can report on it.
+    """
+    state = request.app.state
+    job: dict[str, Any] | None = getattr(state, "ingest_job", None)
+    if job is not None and not job["task"].done():
+        return IngestionTriggerResponse(
+            status="already_running",
+            message=f"A {job['kind']} ingestion is already running; poll /admin/ingest/status.",
+            result={"job_id": job["job_id"]},
+        )
+
+    job = {
+        "job_id": uuid4().hex[:12],
+        "kind": kind,
+        "started_at": datetime.now(UTC).isoformat(),
+    }
+    task = asyncio.create_task(run())
+    job["task"] = task
+    task.add_done_callback(lambda t: _on_job_done(job, t))
+    state.ingest_job = job
+
+    logger.info(f"api.admin.ingest.{kind}_triggered", job_id=job["job_id"])
+    return IngestionTriggerResponse(
+        status="running",
+        message=f"{kind.capitalize()} ingestion started; poll /admin/ingest/status.",
+        result={"job_id": job["job_id"]},
+    )
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
 
 
-@router.post("", response_model=IngestionTriggerResponse)
+@router.post("", response_model=IngestionTriggerResponse, status_code=202)
 async def trigger_full_ingestion(
     request: Request,
 ) -> IngestionTriggerResponse:
-    """Trigger a full scheme ingestion from all sources.
+    """Start a full scheme ingestion from all sources.
 
     This will:
     1. Fetch all schemes from MyScheme.gov.in.
@@ -90,62 +174,26 @@ async def trigger_full_ingestion(
     3. Merge with bundled seed data.
     4. Deduplicate, validate, and save.
 
-    **Note:** This is a long-running operation and may take several
-    minutes depending on the number of schemes and network conditions.
+    **Note:** A full run may take several minutes, so it runs in the
+    background.  The response carries the job ID; poll ``/status`` for
+    progress and the result.
     """
     pipeline = _get_pipeline(request)
+    return _start_job(request, "full", pipeline.run_full_ingestion)
 
-    logger.info("api.admin.ingest.full_triggered")
 
-    try:
-        result = await pipeline.run_full_ingestion()
-        return IngestionTriggerResponse(
-            status="completed",
-            message=(
-                f"Full ingestion completed. Fetched {result.total_fetched} schemes "
-                f"({result.new_schemes} new, {result.updated_schemes} updated, "
-                f"{result.failed_schemes} failed) in {result.duration_seconds:.1f}s."
-            ),
-            result=result.to_dict(),
-        )
-    except Exception:
-        logger.error("api.admin.ingest.full_failed", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail="Ingestion failed. Check server logs for details.",
-        ) from None
-
-
-@router.post("/incremental", response_model=IngestionTriggerResponse)
+@router.post("/incremental", response_model=IngestionTriggerResponse, status_code=202)
 async def trigger_incremental_ingestion(
     request: Request,
 ) -> IngestionTriggerResponse:
-    """Trigger an incremental scheme data update.
+    """Start an incremental scheme data update.
 
     Only fetches and updates schemes that have changed since the last
-    ingestion run.  Much faster than a full ingestion.
+    ingestion run.  Much faster than a full ingestion, but still runs in
+    the background; poll ``/status`` for the result.
     """
     pipeline = _get_pipeline(request)
-
-    logger.info("api.admin.ingest.incremental_triggered")
-
-    try:
-        result = await pipeline.run_incremental_update()
-        return IngestionTriggerResponse(
-            status="completed",
-            message=(
-                f"Incremental update completed. {result.new_schemes} new, "
-                f"{result.updated_schemes} updated, {result.failed_schemes} failed "
-                f"in {result.duration_seconds:.1f}s."
-            ),
-            result=result.to_dict(),
-        )
-    except Exception:
-        logger.error("api.admin.ingest.incremental_failed", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail="Incremental ingestion failed. Check server logs for details.",
-        ) from None
+    return _start_job(request, "incremental", pipeline.run_incremental_update)
 
 
 @router.get("/status", response_model=IngestionStatusResponse)
@@ -155,6 +203,7 @@ async def get_ingestion_status(
     """Get the status and result of the last ingestion run.
 
     Returns information about:
+    - The running job, if any, and the outcome of the latest job.
     - The last ingestion result (counts, errors, duration).
     - Whether the background scheduler is running.
     - Timestamps of the last full and incremental runs.
@@ -186,10 +235,21 @@ async def get_ingestion_status(
         if scheduler.last_incremental_run is not None:
             last_incremental = scheduler.last_incremental_run.isoformat()
 
-    status = "ready" if pipeline is not None else "not_initialised"
+    job = getattr(request.app.state, "ingest_job", None)
+    last_job = _job_summary(job) if job is not None else None
+    running_job_id = last_job["job_id"] if last_job and last_job["status"] == "running" else None
+
+    if pipeline is None:
+        status = "not_initialised"
+    elif running_job_id is not None:
+        status = "running"
+    else:
+        status = "ready"
 
     return IngestionStatusResponse(
         status=status,
+        running_job_id=running_job_id,
+        last_job=last_job,
         last_result=last_result,
         scheduler_running=scheduler_running,
         last_full_run=last_full,
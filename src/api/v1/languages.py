@@ -6,13 +6,17 @@ English, including native names, scripts, and GCP service support.
 
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+from dataclasses import asdict
+from typing import Any, Final
 
+import orjson
 import structlog
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 
-from config.languages import LANGUAGES, get_language, get_supported_languages
+from config.languages import LANGUAGES, LanguageConfig, get_language, get_supported_languages
+from src.api.etag import etag_matches
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
@@ -61,18 +65,12 @@ class LanguageDetailResponse(BaseModel):
 
 
 # ---------------------------------------------------------------------------
-# Endpoints
+# Precomputed payloads
 # ---------------------------------------------------------------------------
 
 
-@router.get("", response_model=LanguageListResponse)
-async def list_languages() -> LanguageListResponse:
-    """List all 23 supported languages (22 Scheduled Languages + English).
-
-    Results are sorted by speaker population in descending order.
-    """
-    all_langs = get_supported_languages()
-
+def _build_language_list() -> LanguageListResponse:
+    """Build the language list from the static language registry."""
     languages = [
         LanguageInfo(
             code=lang.code,
@@ -84,18 +82,88 @@ async def list_languages() -> LanguageListResponse:
             is_high_priority=lang.is_high_priority,
             population_millions=lang.population_millions,
         )
-        for lang in all_langs
+        for lang in get_supported_languages()
     ]
-
     return LanguageListResponse(languages=languages, total=len(languages))
 
 
+def _build_language_detail(lang: LanguageConfig) -> LanguageDetailResponse:
+    """Build the detail payload for a single language."""
+    return LanguageDetailResponse(
+        code=lang.code,
+        name_english=lang.name_english,
+        name_native=lang.name_native,
+        script=lang.script,
+        gcp_translation_code=lang.gcp_translation_code,
+        gcp_tts_code=lang.gcp_tts_code,
+        gcp_stt_code=lang.gcp_stt_code,
+        has_tts=lang.gcp_tts_code is not None,
+        has_stt=lang.gcp_stt_code is not None,
+        is_high_priority=lang.is_high_priority,
+        population_millions=lang.population_millions,
+    )
+
+
+# The registry is fixed at import time, so the list and every detail
+# payload are serialised once.  Details are keyed by canonical code;
+# aliases resolve through ``get_language`` first.
+_LANGUAGE_LIST_JSON: Final[bytes] = orjson.dumps(_build_language_list().model_dump())
+_LANGUAGE_DETAIL_JSON: Final[dict[str, bytes]] = {
+    lang.code: orjson.dumps(_build_language_detail(lang).model_dump())
+    for lang in get_supported_languages()
+}
+
+# Strong ETag over the whole registry, shared by the list and detail
+# endpoints; it only changes when config/languages.py does.
+_LANGUAGES_ETAG: Final[str] = '"{}"'.format(
+    hashlib.sha256(
+        orjson.dumps([asdict(lang) for lang in get_supported_languages()])
+    ).hexdigest()[:16]
+)
+
+_LANGUAGES_CACHE_HEADERS: Final[dict[str, str]] = {
+    "ETag": _LANGUAGES_ETAG,
+    "Cache-Control": "public, max-age=86400",
+}
+
+
+def _not_modified(request: Request) -> Response | None:
+    """Return a ``304`` if the client already holds the current registry."""
+    if etag_matches(request, _LANGUAGES_ETAG):
+        return Response(status_code=304, headers=_LANGUAGES_CACHE_HEADERS)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------------------------
+
+
+@router.get("", response_model=LanguageListResponse)
+async def list_languages(request: Request) -> Response:
+    """List all 23 supported languages (22 Scheduled Languages + English).
+
+    Results are sorted by speaker population in descending order.  The
+    response is cacheable and carries an ``ETag``; a matching
+    ``If-None-Match`` gets ``304 Not Modified``.
+    """
+    not_modified = _not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    return Response(
+        content=_LANGUAGE_LIST_JSON,
+        media_type="application/json",
+        headers=_LANGUAGES_CACHE_HEADERS,
+    )
+
+
 @router.get("/{code}", response_model=LanguageDetailResponse)
-async def get_language_detail(code: str) -> LanguageDetailResponse:
+async def get_language_detail(code: str, request: Request) -> Response:
     """Get full details for a specific language by its ISO code.
 
     Accepts both ISO 639-1 (e.g. ``hi``) and ISO 639-3 (e.g. ``mai``)
-    codes, as well as common aliases (e.g. ``hin`` for Hindi).
+    codes, as well as common aliases (e.g. ``hin`` for Hindi).  Carries
+    the same ``ETag`` and cache policy as the language list.
     """
     lang = get_language(code)
 
@@ -105,16 +173,11 @@ async def get_language_detail(code: str) -> LanguageDetailResponse:
             detail=f"Language code '{code}' not found. Use GET /api/v1/languages to see all supported codes.",
         )
 
-    return LanguageDetailResponse(
-        code=lang.code,
-        name_english=lang.name_english,
-        name_native=lang.name_native,
-        script=lang.script,
-        gcp_translation_code=lang.gcp_translation_code,
-        gcp_tts_code=lang.gcp_tts_code,
-        gcp_stt_code=lang.gcp_stt_code,
-        has_tts=lang.gcp_tts_code is not None,
-        has_stt=lang.gcp_stt_code is not None,
-        is_high_priority=lang.is_high_priority,
-        population_millions=lang.population_millions,
+    not_modified = _not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    return Response(
+        content=_LANGUAGE_DETAIL_JSON[lang.code],
+        media_type="application/json",
+        headers=_LANGUAGES_CACHE_HEADERS,
     )
@@ -7,14 +7,32 @@ disclaimer that this is NOT legal advice.
 
 from __future__ import annotations
 
+import hashlib
+from typing import TYPE_CHECKING, Final
+
+import orjson
 import structlog
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 
+from src.api.etag import etag_matches
+
+if TYPE_CHECKING:
+    from src.services.legal_rights import BNSSection
+
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/legal-rights", tags=["legal-rights"])
 
+_BNS_DISCLAIMER: Final[str] = (
+    "This information is for educational purposes only. "
+    "This is NOT legal advice. Please consult a lawyer or DLSA."
+)
+
+# BNS sections are a fixed table, so each found section's response is
+# serialised once: section number -> (ETag, JSON body).
+_bns_responses: dict[int, tuple[str, bytes]] = {}
+
 
 class RightsQueryRequest(BaseModel):
     situation: str = Field(
@@ -25,10 +43,61 @@ class RightsQueryRequest(BaseModel):
     state: str | None = Field(default=None, description="State for state-specific laws")
 
 
-@router.post("/identify")
+class ApplicableLawOut(BaseModel):
+    model_config = {"from_attributes": True}
+
+    law: str
+    description: str
+    relevance: str
+    bns_section: str | None = None
+    act_name: str = ""
+
+
+class ApplicableRightOut(BaseModel):
+    model_config = {"from_attributes": True}
+
+    right_name: str
+    source_law: str
+    description: str
+    how_to_exercise: str
+
+
+class AnalysisHelplineOut(BaseModel):
+    model_config = {"from_attributes": True}
+
+    name: str
+    number: str
+    description: str
+
+
+class HelplineOut(AnalysisHelplineOut):
+    hours: str
+    languages: list[str]
+
+
+class RightsAnalysisResponse(BaseModel):
+    """Projection of the service's ``LegalAnalysis`` for ``/identify``."""
+
+    model_config = {"from_attributes": True}
+
+    situation_summary: str
+    applicable_laws: list[ApplicableLawOut]
+    applicable_rights: list[ApplicableRightOut]
+    recommended_actions: list[str]
+    helplines: list[AnalysisHelplineOut]
+    severity: str
+    disclaimer: str
+
+
+class HelplinesResponse(BaseModel):
+    category: str
+    helplines: list[HelplineOut]
+
+
+@router.post("/identify", response_model=RightsAnalysisResponse)
 async def identify_applicable_rights(
     body: RightsQueryRequest, request: Request
-) -> dict:
+) -> RightsAnalysisResponse:
     """Identify which laws, rights, and schemes may apply to a situation.
 
     The citizen describes their problem in their own words, and the
@@ -48,42 +117,14 @@ async def identify_applicable_rights(
         logger.error("api.legal_rights.identify_failed", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to analyze situation") from None
 
-    return {
-        "situation_summary": analysis.situation_summary,
-        "applicable_laws": [
-            {
-                "law": law.law,
-                "description": law.description,
-                "relevance": law.relevance,
-                "bns_section": law.bns_section,
-                "act_name": law.act_name,
-            }
-            for law in analysis.applicable_laws
-        ],
-        "applicable_rights": [
-            {
-                "right_name": right.right_name,
-                "source_law": right.source_law,
-                "description": right.description,
-                "how_to_exercise": right.how_to_exercise,
-            }
-            for right in analysis.applicable_rights
-        ],
-        "recommended_actions": analysis.recommended_actions,
-        "helplines": [
-            {"name": h.name, "number": h.number, "description": h.description}
-            for h in analysis.helplines
-        ],
-        "severity": analysis.severity,
-        "disclaimer": analysis.disclaimer,
-    }
-
-
-@router.get("/helplines")
+    return RightsAnalysisResponse.model_validate(analysis)
+
+
+@router.get("/helplines", response_model=HelplinesResponse)
 async def get_helplines(
     category: str = "general",
     request: Request = None,
-) -> dict:
+) -> HelplinesResponse:
     """Get emergency and legal helpline numbers.
 
     Categories: general, women, children, sc_st, labor, consumer,
@@ -93,48 +134,47 @@ async def get_helplines(
     if legal_rights is None:
         raise HTTPException(status_code=503, detail="Legal rights service not available")
 
-    helplines = legal_rights.get_helplines(category)
-    return {
-        "category": category,
-        "helplines": [
-            {
-                "name": h.name,
-                "number": h.number,
-                "description": h.description,
-                "hours": h.hours,
-                "languages": h.languages,
-            }
-            for h in helplines
-        ],
-    }
+    return HelplinesResponse(category=category, helplines=legal_rights.get_helplines(category))
+
+
+def _bns_response(section: BNSSection) -> tuple[str, bytes]:
+    """Serialise *section* with its disclaimer and derive a strong ETag."""
+    body = orjson.dumps({
+        "section_number": section.section_number,
+        "title": section.title,
+        "description": section.description,
+        "old_ipc_section": section.old_ipc_section,
+        "punishment": section.punishment,
+        "bailable": section.bailable,
+        "cognizable": section.cognizable,
+        "disclaimer": _BNS_DISCLAIMER,
+    })
+    return f'"{hashlib.sha256(body).hexdigest()[:16]}"', body
 
 
 @router.get("/bns/{section_number}")
 async def get_bns_section(
     section_number: int, request: Request
-) -> dict:
+) -> Response:
     """Get information about a specific BNS (Bharat Nyaya Sanhita) section.
 
-    The BNS replaced the Indian Penal Code from 1 July 2024.
+    The BNS replaced the Indian Penal Code from 1 July 2024.  Responses
+    are cacheable and carry an ``ETag``; a matching ``If-None-Match``
+    gets ``304 Not Modified``.
     """
     legal_rights = getattr(request.app.state, "legal_rights", None)
     if legal_rights is None:
         raise HTTPException(status_code=503, detail="Legal rights service not available")
 
-    section = legal_rights.get_bns_section(section_number)
-    if section is None:
-        raise HTTPException(status_code=404, detail=f"BNS Section {section_number} not found")
-
-    return {
-        "section_number": section.section_number,
-        "title": section.title,
-        "description": section.description,
-        "old_ipc_section": section.old_ipc_section,
-        "punishment": section.punishment,
-        "bailable": section.bailable,
-        "cognizable": section.cognizable,
-        "disclaimer": (
-            "This information is for educational purposes only. "
-            "This is NOT legal advice. Please consult a lawyer or DLSA."
-        ),
-    }
+    cached = _bns_responses.get(section_number)
+    if cached is None:
+        section = legal_rights.get_bns_section(section_number)
+        if section is None:
+            raise HTTPException(status_code=404, detail=f"BNS Section {section_number} not found")
+        cached = _bns_responses[section_number] = _bns_response(section)
+
+    etag, body = cached
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=86400"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
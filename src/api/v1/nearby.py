@@ -6,22 +6,135 @@ CSCs, courts, and legal aid centers.
 
 from __future__ import annotations
 
+import asyncio
+import re
+from typing import Any, Final
+
 import structlog
 from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel, Field
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/nearby", tags=["nearby-services"])
 
+# Six ASCII digits; ``str.isdigit`` would also accept e.g. Devanagari digits.
+_PIN_CODE_PATTERN: Final[re.Pattern[str]] = re.compile(r"[0-9]{6}")
+
+# In-flight /find lookups keyed by locator and exact query; concurrent
+# identical requests share one worker-thread call.
+_inflight_find: dict[tuple[Any, ...], asyncio.Future[list[Any]]] = {}
+
+
+async def _find_nearby_shared(
+    locator: Any,
+    latitude: float,
+    longitude: float,
+    service_type: str,
+    radius_km: float,
+) -> list[Any]:
+    """Run ``locator.find_nearby`` off the event loop, coalescing duplicates.
+
+    The locator may fall back to a blocking Google Places request, so the
+    call runs in a worker thread.  Callers with the same query while it is
+    running await the same future; ``shield`` keeps one client's
+    disconnect from cancelling the lookup for the others.
+    """
+    key = (locator, latitude, longitude, service_type, radius_km)
+    future = _inflight_find.get(key)
+    if future is None:
+        future = asyncio.ensure_future(
+            asyncio.to_thread(locator.find_nearby, latitude, longitude, service_type, radius_km)
+        )
+        _inflight_find[key] = future
+        future.add_done_callback(lambda _: _inflight_find.pop(key, None))
+    return await asyncio.shield(future)
+
+
+# ---------------------------------------------------------------------------
+# Response schemas
+# ---------------------------------------------------------------------------
+# Item models read the locator's result objects via ``from_attributes``,
+# so the envelopes below accept the service lists as-is.
+
+
+class NearbyResultOut(BaseModel):
+    """A nearby service centre, projected from a ``ServiceLocation``."""
+
+    model_config = {"from_attributes": True}
+
+    name: str
+    type: str = Field(validation_alias="service_type")
+    address: str
+    phone: str | None = None
+    distance_km: float | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    hours: str = Field(validation_alias="working_hours")
+
+
+class NearbyFindResponse(BaseModel):
+    """Response for ``GET /nearby/find``."""
+
+    service_type: str
+    radius_km: float
+    results: list[NearbyResultOut]
+    count: int
+
+
+class CSCOut(BaseModel):
+    """A Common Service Centre, projected from a ``CSCInfo``."""
+
+    model_config = {"from_attributes": True}
+
+    name: str
+    address: str
+    phone: str | None = None
+    vle_name: str | None = None
+    services: list[str] = Field(validation_alias="services_offered")
+
+
+class CSCListResponse(BaseModel):
+    """Response for ``GET /nearby/csc/{pin_code}``."""
+
+    pin_code: str
+    cscs: list[CSCOut]
+    count: int
+
 
-@router.get("/find")
+class DirectoryEntryOut(BaseModel):
+    """A service directory entry, projected from a ``ServiceLocation``."""
+
+    model_config = {"from_attributes": True}
+
+    name: str
+    type: str = Field(validation_alias="service_type")
+    address: str
+    phone: str | None = None
+
+
+class ServiceDirectoryResponse(BaseModel):
+    """Response for ``GET /nearby/directory/{state}``."""
+
+    state: str
+    service_type: str
+    services: list[DirectoryEntryOut]
+    count: int
+
+
+# ---------------------------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------------------------
+
+
+@router.get("/find", response_model=NearbyFindResponse)
 async def find_nearby_services(
     latitude: float,
     longitude: float,
     service_type: str = "csc",
     radius_km: float = 25.0,
     request: Request = None,
-) -> dict:
+) -> NearbyFindResponse:
     """Find nearby government services by location.
 
     Service types: csc, dlsa, tehsil, block_office, post_office,
@@ -31,25 +144,13 @@ async def find_nearby_services(
     if locator is None:
         raise HTTPException(status_code=503, detail="Nearby services not available")
 
-    results = locator.find_nearby(latitude, longitude, service_type, radius_km)
-    return {
-        "service_type": service_type,
-        "radius_km": radius_km,
-        "results": [
-            {
-                "name": r.name,
-                "type": r.service_type,
-                "address": r.address,
-                "phone": r.phone,
-                "distance_km": r.distance_km,
-                "latitude": r.latitude,
-                "longitude": r.longitude,
-                "hours": r.hours,
-            }
-            for r in results
-        ],
-        "count": len(results),
-    }
+    results = await _find_nearby_shared(locator, latitude, longitude, service_type, radius_km)
+    return NearbyFindResponse(
+        service_type=service_type,
+        radius_km=radius_km,
+        results=results,
+        count=len(results),
+    )
 
 
 @router.get("/dlsa/{state}")
@@ -83,62 +184,41 @@ async def get_dlsa_info(
     }
 
 
-@router.get("/csc/{pin_code}")
+@router.get("/csc/{pin_code}", response_model=CSCListResponse)
 async def get_csc_by_pincode(
     pin_code: str, request: Request
-) -> dict:
+) -> CSCListResponse:
     """Find Common Service Centres (CSC) by PIN code.
 
     CSCs provide digital services including scheme applications,
     certificate generation, and banking services in rural areas.
     """
+    if _PIN_CODE_PATTERN.fullmatch(pin_code) is None:
+        raise HTTPException(status_code=400, detail="Invalid PIN code. Must be 6 digits.")
+
     locator = getattr(request.app.state, "nearby_services", None)
     if locator is None:
         raise HTTPException(status_code=503, detail="Nearby services not available")
 
-    if not pin_code.isdigit() or len(pin_code) != 6:
-        raise HTTPException(status_code=400, detail="Invalid PIN code. Must be 6 digits.")
-
     results = locator.get_csc_info(pin_code)
-    return {
-        "pin_code": pin_code,
-        "cscs": [
-            {
-                "name": c.name,
-                "address": c.address,
-                "phone": c.phone,
-                "vle_name": c.vle_name,
-                "services": c.services,
-            }
-            for c in results
-        ],
-        "count": len(results),
-    }
+    return CSCListResponse(pin_code=pin_code, cscs=results, count=len(results))
 
 
-@router.get("/directory/{state}")
+@router.get("/directory/{state}", response_model=ServiceDirectoryResponse)
 async def get_service_directory(
     state: str,
     service_type: str = "all",
     request: Request = None,
-) -> dict:
+) -> ServiceDirectoryResponse:
     """Get a directory of government services in a state."""
     locator = getattr(request.app.state, "nearby_services", None)
     if locator is None:
         raise HTTPException(status_code=503, detail="Nearby services not available")
 
     services = locator.get_service_directory(state, service_type)
-    return {
-        "state": state,
-        "service_type": service_type,
-        "services": [
-            {
-                "name": s.name,
-                "type": s.service_type,
-                "address": s.address,
-                "phone": s.phone,
-            }
-            for s in services
-        ],
-        "count": len(services),
-    }
+    return ServiceDirectoryResponse(
+        state=state,
+        service_type=service_type,
+        services=services,
+        count=len(services),
+    )
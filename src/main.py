@@ -8,6 +8,7 @@ RAG, SchemeSearch, Cache, Hinglish, Orchestrator).
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import time
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
@@ -88,7 +89,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         region=settings.gcp_region,
     )
 
-    app.state.start_time = time.time()
+    # Monotonic, for uptime only: immune to wall-clock adjustments.
+    app.state.start_time = time.monotonic()
 
     # -- 1. Cache -----------------------------------------------------------
     from src.services.cache import CacheManager
@@ -456,6 +458,39 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             logger.warning("app.messaging_init_failed", exc_info=True)
     app.state.messaging = messaging_service
 
+    # -- 23. Admin auto-fix orchestrator & Claude CLI bridge -------------------
+    # Built once here so admin recovery endpoints never construct them
+    # (or pay their imports) on the request path.
+    autofix_orchestrator = None
+    claude_cli_bridge = None
+    try:
+        from src.services.autofix_orchestrator import AutoFixOrchestrator
+        from src.services.claude_cli_bridge import ClaudeCLIBridge
+
+        autofix_orchestrator = AutoFixOrchestrator(
+            project_id=settings.gcp_project_id,
+            model_name=settings.vertex_ai_model.replace("flash", "pro")
+            if "flash" in settings.vertex_ai_model
+            else "gemini-3.0-pro",
+            region=settings.vertex_ai_location,
+        )
+        claude_cli_bridge = ClaudeCLIBridge()
+        logger.info("app.admin_autofix_initialised")
+    except Exception:
+        logger.warning("app.admin_autofix_init_failed", exc_info=True)
+    app.state.autofix_orchestrator = autofix_orchestrator
+    app.state.claude_cli_bridge = claude_cli_bridge
+
+    # -- 24. Admin audit log writer --------------------------------------------
+    # Admin endpoints hand audit lines to this task instead of formatting
+    # the structured log record on the request path.
+    from src.api.v1.admin_recovery import drain_audit_log, restore_spilled_snapshots
+
+    audit_log_task = asyncio.create_task(drain_audit_log())
+
+    # -- 25. Rollback points spilled to disk by earlier processes --------------
+    await restore_spilled_snapshots()
+
     logger.info("app.startup_complete")
 
     yield
@@ -463,6 +498,18 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # -- Shutdown -----------------------------------------------------------
     logger.info("app.shutdown_start")
 
+    # Stop the audit log writer (flushes any queued entries)
+    audit_log_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await audit_log_task
+
+    # Cancel a manually triggered ingestion run still in flight
+    ingest_job = getattr(app.state, "ingest_job", None)
+    if ingest_job is not None and not ingest_job["task"].done():
+        ingest_job["task"].cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await ingest_job["task"]
+
     # Stop ingestion scheduler
     if scheduler is not None:
         await scheduler.stop()
@@ -147,9 +147,10 @@ class DPDPAMiddleware(BaseHTTPMiddleware):
         response.headers["Cross-Origin-Resource-Policy"] = "same-origin"
 
         # Cache control: allow caching for static assets, no-store for API
+        # unless the endpoint set its own policy (static reference data).
         if path.startswith("/static/"):
             response.headers["Cache-Control"] = "public, max-age=86400, immutable"
-        else:
+        elif "cache-control" not in response.headers:
             response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, private"
             response.headers["Pragma"] = "no-cache"
 
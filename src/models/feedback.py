@@ -82,7 +82,7 @@ class FeedbackListResponse(BaseModel):
     """Paginated list of feedback entries."""
 
     feedbacks: list[dict]
-    total: int
+    total: int | None = None  # None when the listing skipped the full count
     page: int
     page_size: int
 
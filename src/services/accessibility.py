@@ -78,14 +78,24 @@ class HapticPattern(BaseModel):
     ``pattern`` is a list of durations in milliseconds, alternating between
     *vibrate* and *pause*.  For example ``[200, 100, 200]`` means
     "vibrate 200 ms, pause 100 ms, vibrate 200 ms".
+
+    Frozen because the pre-defined patterns are shared module-level
+    instances handed straight to callers.
     """
 
+    model_config = {"frozen": True}
+
     pattern: list[int] = Field(default_factory=list)
     description: str = ""
 
 
 class ISLGesture(BaseModel):
-    """A single Indian Sign Language gesture description."""
+    """A single Indian Sign Language gesture description.
+
+    Frozen because vocabulary gestures are shared across responses.
+    """
+
+    model_config = {"frozen": True}
 
     gloss: str = ""
     hand_shape: str = ""
@@ -101,6 +111,8 @@ class ISLDescription(BaseModel):
     ``video_url`` is a placeholder for a future avatar-video endpoint.
     """
 
+    model_config = {"frozen": True}
+
     gestures: list[ISLGesture] = Field(default_factory=list)
     video_url: str | None = None
 
@@ -19,7 +19,6 @@ import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Final
-from uuid import uuid4
 
 import structlog
 
@@ -244,8 +243,10 @@ class AutoFixOrchestrator:
         -------
         DiagnosisReport
         """
+        from src.api.v1.admin_recovery import _next_id
+
         start = time.monotonic()
-        report_id = f"diag-{datetime.now(UTC).strftime('%Y%m%d-%H%M%S')}-{uuid4().hex[:6]}"
+        report_id = f"diag-{datetime.now(UTC).strftime('%Y%m%d-%H%M%S')}-{_next_id()}"
 
         # Step 1: Gather system state
         system_state = self._gather_system_state(app_state)
@@ -302,6 +303,7 @@ class AutoFixOrchestrator:
 
     def _gather_system_state(self, app_state: Any) -> dict[str, Any]:
         """Collect all relevant system state for diagnosis."""
+        from src.api.v1.admin_recovery import _scheme_id_index
         from src.api.v1.feedback import _feedback_index, _feedback_store
         from src.api.v1.profile import _profiles
 
@@ -310,27 +312,24 @@ class AutoFixOrchestrator:
         cache = getattr(app_state, "cache", None)
         self_sustaining = getattr(app_state, "self_sustaining", None)
 
-        scheme_ids = {getattr(s, "scheme_id", "") for s in scheme_data}
+        scheme_ids, id_counts = _scheme_id_index(app_state)
 
         # Detect issues
-        orphan_verifications = [k for k in verification_results if k not in scheme_ids]
+        orphan_verifications = verification_results.keys() - scheme_ids
         orphan_feedback = sum(
             1 for fb in _feedback_store.values()
             if fb.scheme_id and fb.scheme_id not in scheme_ids
         )
-        index_mismatches = len(_feedback_index) - len(
-            [fid for fid in _feedback_index if fid in _feedback_store]
-        )
-        missing_from_index = len(
-            [fid for fid in _feedback_store if fid not in _feedback_index]
-        )
-        duplicate_scheme_ids = len(scheme_data) - len(scheme_ids)
+        index_mismatches = sum(1 for fid in _feedback_index if fid not in _feedback_store)
+        missing_from_index = len(_feedback_store.keys() - set(_feedback_index))
+        duplicate_scheme_ids = len(scheme_data) - len(id_counts)
         profiles_without_consent = sum(
             1 for p in _profiles.values() if not p.consent_given
         )
         profiles_without_location = sum(
             1 for p in _profiles.values() if not p.state and not p.pin_code
         )
+        now = time.monotonic()
 
         return {
             "system_status": {
@@ -353,7 +352,7 @@ class AutoFixOrchestrator:
             },
             "recent_errors": [],
             "performance_metrics": {
-                "uptime_seconds": time.time() - getattr(app_state, "start_time", time.time()),
+                "uptime_seconds": now - getattr(app_state, "start_time", now),
             },
         }
 
@@ -526,11 +525,13 @@ class AutoFixOrchestrator:
 
     def _build_actions(self, diagnosis: dict[str, Any]) -> list[FixAction]:
         """Convert diagnosis issues into executable FixAction objects."""
+        from src.api.v1.admin_recovery import _next_id
+
         actions = []
         for item in diagnosis.get("diagnosis", []):
             action_name = item.get("fix_action", "unknown")
             actions.append(FixAction(
-                action_id=uuid4().hex[:10],
+                action_id=_next_id(),
                 action_name=action_name,
                 description=item.get("issue", ""),
                 severity=item.get("severity", "medium"),
@@ -605,75 +606,60 @@ class AutoFixOrchestrator:
 
     async def _fix_create_snapshot(self, app_state: Any) -> str:
         """Create a pre-fix snapshot for rollback safety."""
-        from src.api.v1.admin_recovery import _record_audit, _rollback_points, _snapshots
-
-        import copy
-        import hashlib
-
-        from src.api.v1.feedback import _feedback_index, _feedback_store
-        from src.api.v1.profile import _profiles
+        from src.api.v1.admin_recovery import (
+            _capture_snapshot_data,
+            _encode_snapshot,
+            _next_id,
+            _record_audit,
+            _store_snapshot,
+        )
 
         scheme_data = getattr(app_state, "scheme_data", [])
         verification_results = getattr(app_state, "verification_results", {})
 
-        snapshot_id = f"autofix-{datetime.now(UTC).strftime('%Y%m%d-%H%M%S')}-{uuid4().hex[:6]}"
-        data: dict[str, Any] = {}
-
-        if scheme_data:
-            data["schemes"] = [
-                s.model_dump(mode="json") if hasattr(s, "model_dump") else str(s)
-                for s in scheme_data
-            ]
-        if verification_results:
-            data["verification"] = copy.deepcopy(verification_results)
-        if _feedback_store:
-            data["feedback"] = {fid: fb.model_dump(mode="json") for fid, fb in _feedback_store.items()}
-            data["feedback_index"] = list(_feedback_index)
-        if _profiles:
-            data["profiles"] = {
-                pid: p.model_dump(mode="json") if hasattr(p, "model_dump") else str(p)
-                for pid, p in _profiles.items()
-            }
-
-        raw = json.dumps(data, sort_keys=True, default=str)
-        checksum = hashlib.sha256(raw.encode()).hexdigest()[:16]
-
-        snapshot = {
-            "snapshot_id": snapshot_id,
-            "created_at": datetime.now(UTC).isoformat(),
-            "components": list(data.keys()),
-            "data": data,
-            "checksum": checksum,
-        }
-        _snapshots[snapshot_id] = snapshot
-        _rollback_points.insert(0, {
-            "snapshot_id": snapshot_id,
-            "created_at": snapshot["created_at"],
-            "components": snapshot["components"],
-            "checksum": checksum,
-        })
+        now = datetime.now(UTC)
+        snapshot_id = f"autofix-{now.strftime('%Y%m%d-%H%M%S')}-{_next_id()}"
+        data, components = _capture_snapshot_data(scheme_data, verification_results)
+        if not data:
+            return "Nothing to snapshot: all data stores are empty"
+
+        checksum, size_bytes, blob = _encode_snapshot(data)
+        await _store_snapshot(
+            {
+                "snapshot_id": snapshot_id,
+                "created_at": now.isoformat(),
+                "components": components,
+                "checksum": checksum,
+            },
+            blob,
+        )
         _record_audit("autofix_snapshot", f"Auto-fix safety snapshot: {snapshot_id}")
-        return f"Snapshot {snapshot_id} created ({len(raw) / 1024:.1f} KB)"
+        return f"Snapshot {snapshot_id} created ({size_bytes / 1024:.1f} KB)"
 
     def _fix_rebuild_feedback_index(self) -> str:
-        from src.api.v1.feedback import _feedback_index, _feedback_store
+        from src.api.v1.feedback import (
+            _feedback_index,
+            _feedback_store,
+            _rebuild_feedback_indexes,
+        )
 
         old_len = len(_feedback_index)
         # Rebuild: keep only IDs that exist in store, then add missing ones
         valid = [fid for fid in _feedback_index if fid in _feedback_store]
-        missing = [fid for fid in _feedback_store if fid not in valid]
+        indexed = set(valid)
+        missing = [fid for fid in _feedback_store if fid not in indexed]
         _feedback_index.clear()
         _feedback_index.extend(valid + missing)
+        _rebuild_feedback_indexes()
         return f"Rebuilt index: {old_len} -> {len(_feedback_index)} entries ({len(missing)} recovered)"
 
     def _fix_remove_orphan_verifications(self, app_state: Any) -> str:
-        scheme_data = getattr(app_state, "scheme_data", [])
+        from src.api.v1.admin_recovery import _prune_orphan_verifications, _scheme_id_index
+
         verification_results = getattr(app_state, "verification_results", {})
-        scheme_ids = {getattr(s, "scheme_id", "") for s in scheme_data}
-        orphans = [k for k in verification_results if k not in scheme_ids]
-        for k in orphans:
-            del verification_results[k]
-        return f"Removed {len(orphans)} orphaned verification results"
+        scheme_ids, _ = _scheme_id_index(app_state)
+        removed = _prune_orphan_verifications(verification_results, scheme_ids)
+        return f"Removed {removed} orphaned verification results"
 
     async def _fix_reload_scheme_data(self, app_state: Any) -> str:
         try:
@@ -720,10 +706,10 @@ class AutoFixOrchestrator:
         return "No duplicates found"
 
     def _fix_feedback_references(self, app_state: Any) -> str:
+        from src.api.v1.admin_recovery import _scheme_id_index
         from src.api.v1.feedback import _feedback_store
 
-        scheme_data = getattr(app_state, "scheme_data", [])
-        scheme_ids = {getattr(s, "scheme_id", "") for s in scheme_data}
+        scheme_ids, _ = _scheme_id_index(app_state)
         cleaned = 0
         for fb in _feedback_store.values():
             if fb.scheme_id and fb.scheme_id not in scheme_ids:
@@ -764,11 +750,8 @@ class AutoFixOrchestrator:
     def _fix_compact_audit_log(self) -> str:
         from src.api.v1.admin_recovery import _admin_audit_log
 
-        old_len = len(_admin_audit_log)
-        if old_len > 1000:
-            _admin_audit_log[:] = _admin_audit_log[:1000]
-            return f"Compacted audit log: {old_len} -> 1000 entries"
-        return f"Audit log already within limits ({old_len} entries)"
+        # The audit log is a bounded deque, so it can never outgrow its cap.
+        return f"Audit log already within limits ({len(_admin_audit_log)} entries)"
 
     def _fix_flag_consent_violations(self) -> str:
         from src.api.v1.profile import _profiles
@@ -265,6 +265,12 @@ class CacheManager:
         except (orjson.JSONDecodeError, ValueError):
             return default
 
+    async def get_raw(self, key: str) -> bytes | None:
+        """Retrieve the stored JSON bytes for *key* without decoding them."""
+        full_key = self._make_key(key)
+        await self._backend()
+        return await self._safe_redis_op("get", full_key)
+
     async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
         """Serialise *value* via *orjson* and store it."""
         full_key = self._make_key(key)
@@ -272,6 +278,17 @@ class CacheManager:
         await self._backend()
         await self._safe_redis_op("set", full_key, raw, ttl_seconds=ttl_seconds)
 
+    async def set_raw(self, key: str, raw: bytes, ttl_seconds: int | None = None) -> None:
+        """Store already-serialised JSON *raw* bytes as-is.
+
+        Use when the caller holds the JSON encoding already (e.g. from
+        ``model.__pydantic_serializer__.to_json``); :meth:`get` reads the
+        entry back like any other.
+        """
+        full_key = self._make_key(key)
+        await self._backend()
+        await self._safe_redis_op("set", full_key, raw, ttl_seconds=ttl_seconds)
+
     async def get_or_set(
         self,
         key: str,
@@ -300,6 +317,22 @@ class CacheManager:
         result = await self._safe_redis_op("exists", full_key)
         return bool(result)
 
+    async def ping(self) -> bool:
+        """Return *True* if the active backend can serve requests.
+
+        The in-memory fallback is always available.  If Redis is active but
+        stops answering, the manager switches to the fallback (as a failed
+        operation would) and *False* is returned so callers can report it.
+        """
+        backend = await self._backend()
+        if not isinstance(backend, RedisCacheBackend):
+            return True
+        if await backend.ping():
+            return True
+        logger.warning("cache.redis_ping_failed")
+        self._redis_available = False
+        return False
+
     # -- Lifecycle -------------------------------------------------------------
 
     async def close(self) -> None:
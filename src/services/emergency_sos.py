@@ -755,6 +755,30 @@ _STATE_DLSA: Final[dict[str, dict[str, str]]] = {
     },
 }
 
+# Emergency types that add the state women's commission / SLSA contacts.
+_WOMEN_COMMISSION_TYPES: Final[frozenset[EmergencyType]] = frozenset({
+    EmergencyType.DOMESTIC_VIOLENCE,
+    EmergencyType.SEXUAL_ASSAULT,
+    EmergencyType.DOWRY_HARASSMENT,
+    EmergencyType.ACID_ATTACK,
+    EmergencyType.TRAFFICKING,
+})
+
+_LEGAL_AID_TYPES: Final[frozenset[EmergencyType]] = frozenset({
+    EmergencyType.DOMESTIC_VIOLENCE,
+    EmergencyType.CHILD_ABUSE,
+    EmergencyType.SEXUAL_ASSAULT,
+    EmergencyType.POLICE_HARASSMENT,
+    EmergencyType.CUSTODIAL_VIOLENCE,
+    EmergencyType.CASTE_VIOLENCE,
+    EmergencyType.ILLEGAL_DETENTION,
+    EmergencyType.LABOUR_EXPLOITATION,
+    EmergencyType.LAND_GRABBING,
+    EmergencyType.ELDER_ABUSE,
+    EmergencyType.DOWRY_HARASSMENT,
+    EmergencyType.TRAFFICKING,
+})
+
 
 # ---------------------------------------------------------------------------
 # Safety plan templates by emergency type
@@ -1160,12 +1184,15 @@ class EmergencySOSService:
         # response.safety_plan.immediate_steps => [...]
     """
 
-    __slots__ = ("_active_reports",)
+    __slots__ = ("_active_reports", "_contacts_cache")
 
     def __init__(self) -> None:
         # In-memory tracking of active emergency reports for follow-up.
         # Production would use a database.
         self._active_reports: dict[str, EmergencyResponse] = {}
+        # Contacts depend only on the parsed type and canonical state, both
+        # drawn from fixed tables, so this memo is naturally bounded.
+        self._contacts_cache: dict[tuple[EmergencyType, str], tuple[EmergencyContact, ...]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -1298,14 +1325,32 @@ class EmergencySOSService:
         list[EmergencyContact]
             Emergency contacts sorted by relevance.
         """
-        contacts: list[EmergencyContact] = []
-
         # Parse emergency type
         try:
             etype = EmergencyType(emergency_type)
         except ValueError:
             etype = EmergencyType.OTHER
 
+        key = (etype, self._normalize_state(state))
+        cached = self._contacts_cache.get(key)
+        if cached is None:
+            cached = self._contacts_cache[key] = self._build_contacts(*key)
+        contacts = list(cached)
+
+        logger.info(
+            "emergency_sos.contacts_retrieved",
+            emergency_type=emergency_type,
+            state=state or "not_specified",
+            total_contacts=len(contacts),
+        )
+
+        return contacts
+
+    @staticmethod
+    def _build_contacts(etype: EmergencyType, normalized_state: str) -> tuple[EmergencyContact, ...]:
+        """Build the contact list for *etype* and a canonical state key."""
+        contacts: list[EmergencyContact] = []
+
         # Get relevant national helpline keys for this emergency type
         helpline_keys = _EMERGENCY_HELPLINE_MAP.get(etype, ["police_emergency", "nalsa"])
 
@@ -1326,18 +1371,9 @@ class EmergencySOSService:
             contacts.append(contact)
 
         # Add state-specific contacts
-        normalized_state = self._normalize_state(state)
-
         if normalized_state:
             # Women's commission (for relevant emergency types)
-            women_types = {
-                EmergencyType.DOMESTIC_VIOLENCE,
-                EmergencyType.SEXUAL_ASSAULT,
-                EmergencyType.DOWRY_HARASSMENT,
-                EmergencyType.ACID_ATTACK,
-                EmergencyType.TRAFFICKING,
-            }
-            if etype in women_types:
+            if etype in _WOMEN_COMMISSION_TYPES:
                 commission = _STATE_WOMEN_COMMISSIONS.get(normalized_state)
                 if commission:
                     contacts.append(EmergencyContact(
@@ -1351,21 +1387,7 @@ class EmergencySOSService:
                     ))
 
             # DLSA (for all emergency types that need legal aid)
-            legal_types = {
-                EmergencyType.DOMESTIC_VIOLENCE,
-                EmergencyType.CHILD_ABUSE,
-                EmergencyType.SEXUAL_ASSAULT,
-                EmergencyType.POLICE_HARASSMENT,
-                EmergencyType.CUSTODIAL_VIOLENCE,
-                EmergencyType.CASTE_VIOLENCE,
-                EmergencyType.ILLEGAL_DETENTION,
-                EmergencyType.LABOUR_EXPLOITATION,
-                EmergencyType.LAND_GRABBING,
-                EmergencyType.ELDER_ABUSE,
-                EmergencyType.DOWRY_HARASSMENT,
-                EmergencyType.TRAFFICKING,
-            }
-            if etype in legal_types:
+            if etype in _LEGAL_AID_TYPES:
                 dlsa = _STATE_DLSA.get(normalized_state)
                 if dlsa:
                     contacts.append(EmergencyContact(
@@ -1377,14 +1399,7 @@ class EmergencySOSService:
                         website=dlsa.get("website"),
                     ))
 
-        logger.info(
-            "emergency_sos.contacts_retrieved",
-            emergency_type=emergency_type,
-            state=state or "not_specified",
-            total_contacts=len(contacts),
-        )
-
-        return contacts
+        return tuple(contacts)
 
     def generate_safety_plan(self, situation: str) -> SafetyPlan:
         """Generate a step-by-step safety plan for a given situation.
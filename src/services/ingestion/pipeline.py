@@ -153,6 +153,18 @@ def _name_similarity(name_a: str, name_b: str) -> float:
     return len(intersection) / len(union) if union else 0.0
 
 
+def _write_schemes_file(path: Path, schemes: list[dict]) -> None:
+    """Write *schemes* to *path* as pretty-printed JSON (blocking)."""
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(schemes, f, ensure_ascii=False, indent=2, default=str)
+
+
+def _read_json_file(path: Path) -> list[dict]:
+    """Read a JSON scheme list from *path* (blocking)."""
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 # ---------------------------------------------------------------------------
 # SchemeIngestionPipeline
 # ---------------------------------------------------------------------------
@@ -264,7 +276,7 @@ class SchemeIngestionPipeline:
         # -- Step 3: Load seed data as fallback ----------------------------
         seed_schemes: list[dict] = []
         try:
-            seed_schemes = self._load_seed_data()
+            seed_schemes = await asyncio.to_thread(self._load_seed_data)
             if seed_schemes:
                 result.sources_used.append("bundled_seed_data")
             logger.info(
@@ -956,9 +968,10 @@ class SchemeIngestionPipeline:
             schemes, key=lambda s: s.get("scheme_id", "")
         )
 
+        # File I/O and encoding of the full catalogue run in a worker
+        # thread so API requests are served while ingestion saves.
         try:
-            with output_path.open("w", encoding="utf-8") as f:
-                json.dump(sorted_schemes, f, ensure_ascii=False, indent=2, default=str)
+            await asyncio.to_thread(_write_schemes_file, output_path, sorted_schemes)
             logger.info(
                 "ingestion.saved_to_file",
                 path=str(output_path),
@@ -992,8 +1005,7 @@ class SchemeIngestionPipeline:
         # Try file
         if _SCHEMES_OUTPUT_PATH.exists():
             try:
-                with _SCHEMES_OUTPUT_PATH.open("r", encoding="utf-8") as f:
-                    return json.load(f)
+                return await asyncio.to_thread(_read_json_file, _SCHEMES_OUTPUT_PATH)
             except (json.JSONDecodeError, OSError):
                 pass
 
@@ -1006,8 +1018,7 @@ class SchemeIngestionPipeline:
             return []
 
         try:
-            with _SEED_PATH.open("r", encoding="utf-8") as f:
-                raw_schemes: list[dict] = json.load(f)
+            raw_schemes = _read_json_file(_SEED_PATH)
 
             # Tag each with the source
             for scheme in raw_schemes:
@@ -0,0 +1,499 @@
+"""Tests for the admin disaster-recovery endpoints and their in-memory stores."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.v1 import admin_recovery
+from src.api.v1.feedback import _feedback_index, _feedback_store, _rebuild_feedback_indexes
+from src.api.v1.profile import _profiles
+
+_BASE = "/api/v1/admin/recovery"
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    """Start every test with empty recovery, feedback and profile stores."""
+    stores = (
+        admin_recovery._snapshots,
+        admin_recovery._admin_audit_log,
+        _feedback_store,
+        _feedback_index,
+        _profiles,
+    )
+    for store in stores:
+        store.clear()
+    _rebuild_feedback_indexes()
+    admin_recovery._invalidate_snapshot_listing()
+    yield
+    for store in stores:
+        store.clear()
+    _rebuild_feedback_indexes()
+    admin_recovery._invalidate_snapshot_listing()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create a test client with a small verification result set."""
+    from src.main import app
+
+    monkeypatch.setattr(app.state, "scheme_data", [], raising=False)
+    monkeypatch.setattr(
+        app.state,
+        "verification_results",
+        {"pm-kisan": {"status": "verified", "score": 0.9}},
+        raising=False,
+    )
+    # A fresh client address per test keeps the shared rate limiter from
+    # carrying request counts across tests.
+    return TestClient(app, headers={"X-Forwarded-For": f"admin-test-{uuid4().hex}"})
+
+
+# -----------------------------------------------------------------------
+# Audit log
+# -----------------------------------------------------------------------
+
+
+class TestAuditLog:
+    def test_newest_entry_first(self) -> None:
+        admin_recovery._record_audit("first", "one")
+        admin_recovery._record_audit("second", "two")
+        assert admin_recovery._admin_audit_log[0]["action"] == "second"
+
+    def test_entry_ids_unique_with_shared_run_prefix(self) -> None:
+        admin_recovery._record_audit("first", "one")
+        admin_recovery._record_audit("second", "two")
+        newer, older = (e["id"] for e in admin_recovery._admin_audit_log)
+        assert newer != older
+        assert newer.split("-")[0] == older.split("-")[0] == admin_recovery._RUN_ID
+
+    async def test_drain_task_takes_over_logging(self) -> None:
+        import asyncio
+
+        task = asyncio.create_task(admin_recovery.drain_audit_log())
+        await asyncio.sleep(0)
+        queue = admin_recovery._audit_log_sink["queue"]
+        assert queue is not None
+
+        admin_recovery._record_audit("queued", "via drain task")
+        assert admin_recovery._admin_audit_log[0]["action"] == "queued"
+        await asyncio.sleep(0)
+        assert queue.empty()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert admin_recovery._audit_log_sink["queue"] is None
+
+    async def test_quiet_actions_kept_but_not_queued(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import asyncio
+
+        monkeypatch.setattr(admin_recovery.settings, "admin_audit_verbose", False)
+        queue: asyncio.Queue = asyncio.Queue()
+        monkeypatch.setitem(admin_recovery._audit_log_sink, "queue", queue)
+
+        admin_recovery._record_audit("status_check", "polled")
+        assert admin_recovery._admin_audit_log[0]["action"] == "status_check"
+        assert queue.empty()
+
+        monkeypatch.setattr(admin_recovery.settings, "admin_audit_verbose", True)
+        admin_recovery._record_audit("status_check", "polled")
+        assert queue.qsize() == 1
+
+    def test_bounded_to_max_entries(self) -> None:
+        for i in range(admin_recovery._MAX_AUDIT_ENTRIES + 25):
+            admin_recovery._record_audit("action", str(i))
+        log = admin_recovery._admin_audit_log
+        assert len(log) == admin_recovery._MAX_AUDIT_ENTRIES
+        assert log[0]["details"] == str(admin_recovery._MAX_AUDIT_ENTRIES + 24)
+
+    def test_endpoint_respects_limit(self, client: TestClient) -> None:
+        for i in range(5):
+            admin_recovery._record_audit("action", str(i))
+        data = client.get(f"{_BASE}/audit-log", params={"limit": 2}).json()
+        assert [e["details"] for e in data["entries"]] == ["4", "3"]
+        assert data["total"] == 5
+
+    @pytest.mark.parametrize("limit", [0, -1, 1001])
+    def test_endpoint_rejects_out_of_range_limit(self, client: TestClient, limit: int) -> None:
+        response = client.get(f"{_BASE}/audit-log", params={"limit": limit})
+        assert response.status_code == 422
+
+
+# -----------------------------------------------------------------------
+# System status
+# -----------------------------------------------------------------------
+
+
+class TestStatus:
+    def test_status_response_shape(self, client: TestClient) -> None:
+        data = client.get(f"{_BASE}/status").json()
+        assert data["status"] == "operational"
+        assert data["data_integrity"]["schemes_verified"] == 1
+        assert "CRITICAL: No scheme data loaded. Run /admin/ingest to load data." in data["recommendations"]
+
+
+# -----------------------------------------------------------------------
+# Snapshots and rollback
+# -----------------------------------------------------------------------
+
+
+class TestSnapshots:
+    def test_checksum_ignores_key_order(self) -> None:
+        first = admin_recovery._encode_snapshot({"b": [1, 2], "a": {"y": 1, "x": 2}})
+        second = admin_recovery._encode_snapshot({"a": {"x": 2, "y": 1}, "b": [1, 2]})
+        assert first[0] == second[0]
+        assert len(first[0]) == 16
+
+    def test_checksum_detects_component_change(self) -> None:
+        checksum, size, _ = admin_recovery._encode_snapshot({"verification": {"a": 1}})
+        changed, _, _ = admin_recovery._encode_snapshot({"verification": {"a": 2}})
+        assert checksum != changed
+        assert size == len(b'{"verification":{"a":1}}')
+
+    @pytest.mark.parametrize(
+        "data",
+        [{}, {"verification": {"a": 1}}, {"schemes": [{"id": 1}], "feedback_index": ["x", "y"]}],
+    )
+    async def test_blob_round_trips(self, data: dict) -> None:
+        import hashlib
+
+        import orjson
+
+        checksum, size, blob = admin_recovery._encode_snapshot(data)
+        raw = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        assert size == len(raw)
+        assert checksum == hashlib.sha256(raw).hexdigest()[:16]
+        assert await admin_recovery._load_snapshot_data({"blob": blob}) == data
+
+    def test_snapshot_registers_rollback_point(self, client: TestClient) -> None:
+        response = client.post(f"{_BASE}/snapshot")
+        assert response.status_code == 200
+        snapshot_id = response.json()["snapshot_id"]
+        listing = client.get(f"{_BASE}/snapshots").json()
+        assert listing["total"] == 1
+        assert listing["snapshots"][0]["snapshot_id"] == snapshot_id
+        assert "verification" in listing["snapshots"][0]["components"]
+        audit = admin_recovery._admin_audit_log[0]
+        assert audit["action"] == "snapshot_created"
+        assert audit["timestamp"] == response.json()["created_at"]
+
+    def test_listing_etag_revalidation(self, client: TestClient) -> None:
+        client.post(f"{_BASE}/snapshot")
+        first = client.get(f"{_BASE}/snapshots")
+        etag = first.headers["etag"]
+        assert first.json()["total"] == 1
+
+        cached = client.get(f"{_BASE}/snapshots", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        listed = client.get(f"{_BASE}/snapshots", headers={"If-None-Match": f'"x", {etag}'})
+        assert listed.status_code == 304
+
+        client.post(f"{_BASE}/snapshot")
+        fresh = client.get(f"{_BASE}/snapshots", headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.json()["total"] == 2
+        assert fresh.headers["etag"] != etag
+
+    def test_empty_snapshot_rejected(self, client: TestClient) -> None:
+        from src.main import app
+
+        app.state.verification_results = {}
+        response = client.post(f"{_BASE}/snapshot")
+        assert response.status_code == 400
+        assert not admin_recovery._snapshots
+
+    async def test_stored_snapshot_is_compressed(self, client: TestClient) -> None:
+        snapshot_id = client.post(f"{_BASE}/snapshot").json()["snapshot_id"]
+        stored = admin_recovery._snapshots[snapshot_id]
+        assert "data" not in stored
+        assert isinstance(stored["blob"], bytes)
+        assert await admin_recovery._load_snapshot_data(stored) == {
+            "verification": {"pm-kisan": {"status": "verified", "score": 0.9}},
+        }
+
+    async def test_snapshot_spilled_to_configured_dir(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch, tmp_path
+    ) -> None:
+        monkeypatch.setattr(admin_recovery.settings, "admin_snapshot_dir", str(tmp_path))
+        snapshot_id = client.post(f"{_BASE}/snapshot").json()["snapshot_id"]
+        stored = admin_recovery._snapshots[snapshot_id]
+        assert "blob" not in stored
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            f"{snapshot_id}.json.zz",
+            f"{snapshot_id}.meta.json",
+        ]
+        assert await admin_recovery._load_snapshot_data(stored) == {
+            "verification": {"pm-kisan": {"status": "verified", "score": 0.9}},
+        }
+
+    async def test_evicted_snapshot_file_removed(self, monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+        monkeypatch.setattr(admin_recovery.settings, "admin_snapshot_dir", str(tmp_path))
+        _, _, blob = admin_recovery._encode_snapshot({"verification": {}})
+        for i in range(admin_recovery._MAX_ROLLBACK_POINTS + 1):
+            await admin_recovery._store_snapshot({"snapshot_id": f"snap-{i}"}, blob)
+        assert "snap-0" not in admin_recovery._snapshots
+        assert not (tmp_path / "snap-0.json.zz").exists()
+        assert not (tmp_path / "snap-0.meta.json").exists()
+        assert len(list(tmp_path.glob("*.json.zz"))) == admin_recovery._MAX_ROLLBACK_POINTS
+
+    async def test_restore_reindexes_spilled_snapshots_and_prunes(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path
+    ) -> None:
+        monkeypatch.setattr(admin_recovery.settings, "admin_snapshot_dir", str(tmp_path))
+        monkeypatch.setattr(admin_recovery, "_MAX_ROLLBACK_POINTS", 2)
+        _, _, blob = admin_recovery._encode_snapshot({"verification": {"a": 1}})
+        for i in range(3):
+            await admin_recovery._store_snapshot(
+                {"snapshot_id": f"snap-{i}", "created_at": f"2025-01-0{i + 1}T00:00:00+00:00"},
+                blob,
+            )
+        # Files an earlier process left behind: an extra old snapshot, an
+        # orphan blob and an interrupted write.
+        (tmp_path / "snap-old.json.zz").write_bytes(blob)
+        (tmp_path / "snap-old.meta.json").write_bytes(
+            b'{"snapshot_id":"snap-old","created_at":"2024-01-01T00:00:00+00:00"}'
+        )
+        (tmp_path / "orphan.json.zz").write_bytes(blob)
+        (tmp_path / "partial.json.tmp").write_bytes(b"x")
+        admin_recovery._snapshots.clear()
+
+        assert await admin_recovery.restore_spilled_snapshots() == 2
+        assert list(admin_recovery._snapshots) == ["snap-2", "snap-1"]
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "snap-1.json.zz",
+            "snap-1.meta.json",
+            "snap-2.json.zz",
+            "snap-2.meta.json",
+        ]
+        restored = admin_recovery._snapshots["snap-2"]
+        assert await admin_recovery._load_snapshot_data(restored) == {"verification": {"a": 1}}
+
+    async def test_autofix_snapshot_registers_rollback_point(self) -> None:
+        from types import SimpleNamespace
+
+        from src.services.autofix_orchestrator import AutoFixOrchestrator
+
+        state = SimpleNamespace(scheme_data=[], verification_results={"pm-kisan": {"status": "ok"}})
+        message = await AutoFixOrchestrator()._fix_create_snapshot(state)
+        assert message.startswith("Snapshot autofix-")
+        newest = next(iter(admin_recovery._snapshots.values()))
+        assert newest["meta"]["components"] == ["verification"]
+        assert f"-{admin_recovery._RUN_ID}-" in newest["meta"]["snapshot_id"]
+
+    def test_schemes_and_profiles_round_trip(self, client: TestClient) -> None:
+        from src.main import app
+        from src.models.scheme import EligibilityCriteria, SchemeCategory, SchemeDocument
+        from src.models.user_profile import UserProfile
+
+        scheme = SchemeDocument(
+            scheme_id="minimal",
+            name="Minimal Scheme",
+            description="Desc",
+            category=SchemeCategory.OTHER,
+            ministry="Ministry",
+            eligibility=EligibilityCriteria(),
+            benefits="Some benefits",
+            application_process="Apply",
+            documents_required=[],
+            last_updated="2025-01-01T00:00:00Z",
+        )
+        profile = UserProfile(state="Uttar Pradesh")
+        app.state.scheme_data = [scheme]
+        _profiles[profile.profile_id] = profile
+
+        snapshot = client.post(f"{_BASE}/snapshot").json()
+        assert snapshot["components"] == ["schemes", "verification", "profiles"]
+
+        app.state.scheme_data = []
+        _profiles.clear()
+        client.post(f"{_BASE}/rollback", json={"snapshot_id": snapshot["snapshot_id"]})
+        assert app.state.scheme_data == [scheme]
+        assert _profiles[profile.profile_id] == profile
+
+    def test_scheme_chunk_reused_until_data_replaced(self) -> None:
+        from types import SimpleNamespace
+
+        schemes = [SimpleNamespace(scheme_id="pm-kisan")]
+        first = admin_recovery._encode_schemes(schemes)
+        assert admin_recovery._encode_schemes(schemes) is first
+
+        replaced = admin_recovery._encode_schemes(list(schemes))
+        assert replaced is not first
+        assert replaced == first
+
+    def test_scheme_chunk_matches_full_encoding(self) -> None:
+        import zlib
+        from types import SimpleNamespace
+
+        import orjson
+
+        data = {"schemes": [SimpleNamespace(scheme_id="pm-kisan")], "verification": {"a": 1}}
+        expected = orjson.dumps(
+            {"schemes": [str(data["schemes"][0])], "verification": {"a": 1}},
+            option=orjson.OPT_SORT_KEYS,
+        )
+        _, size, blob = admin_recovery._encode_snapshot(data)
+        assert zlib.decompress(blob) == expected
+        assert size == len(expected)
+
+    def test_oldest_snapshot_evicted_with_rollback_point(self, client: TestClient) -> None:
+        ids = [
+            client.post(f"{_BASE}/snapshot").json()["snapshot_id"]
+            for _ in range(admin_recovery._MAX_ROLLBACK_POINTS + 1)
+        ]
+        assert len(admin_recovery._snapshots) == admin_recovery._MAX_ROLLBACK_POINTS
+        assert ids[0] not in admin_recovery._snapshots
+        assert next(iter(admin_recovery._snapshots)) == ids[-1]
+
+    def test_rollback_restores_verification(self, client: TestClient) -> None:
+        from src.main import app
+
+        snapshot_id = client.post(f"{_BASE}/snapshot").json()["snapshot_id"]
+        app.state.verification_results["pm-kisan"]["status"] = "disputed"
+
+        response = client.post(
+            f"{_BASE}/rollback",
+            json={"snapshot_id": snapshot_id, "components": ["verification"]},
+        )
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+        assert app.state.verification_results == {"pm-kisan": {"status": "verified", "score": 0.9}}
+
+    def test_rollback_does_not_alias_snapshot(self, client: TestClient) -> None:
+        from src.main import app
+
+        snapshot_id = client.post(f"{_BASE}/snapshot").json()["snapshot_id"]
+        body = {"snapshot_id": snapshot_id, "components": ["verification"]}
+        client.post(f"{_BASE}/rollback", json=body)
+        app.state.verification_results["pm-kisan"]["status"] = "disputed"
+        client.post(f"{_BASE}/rollback", json=body)
+        assert app.state.verification_results["pm-kisan"]["status"] == "verified"
+
+    def test_feedback_round_trip(self, client: TestClient) -> None:
+        fid = client.post(
+            "/api/v1/feedback",
+            json={"feedback_type": "grievance", "description": "Payment has not arrived yet"},
+        ).json()["feedback_id"]
+        snapshot_id = client.post(f"{_BASE}/snapshot").json()["snapshot_id"]
+        _feedback_store.clear()
+        _feedback_index.clear()
+
+        body = {"snapshot_id": snapshot_id, "components": ["feedback"]}
+        assert client.post(f"{_BASE}/rollback", json=body).json()["success"] is True
+        assert list(_feedback_index) == [fid]
+        listed = client.get("/api/v1/feedback", params={"feedback_type": "grievance"}).json()
+        assert [f["feedback_id"] for f in listed["feedbacks"]] == [fid]
+
+    async def test_invalid_component_leaves_store_untouched(self, client: TestClient) -> None:
+        _, _, blob = admin_recovery._encode_snapshot(
+            {"feedback": {"fb-1": {"not": "feedback"}}, "feedback_index": ["fb-1"]}
+        )
+        await admin_recovery._store_snapshot(
+            {
+                "snapshot_id": "snap-bad",
+                "created_at": "2025-01-01T00:00:00+00:00",
+                "components": ["feedback"],
+                "checksum": "0" * 16,
+            },
+            blob,
+        )
+        sentinel = object()
+        _feedback_store["fb-live"] = sentinel
+        _feedback_index.append("fb-live")
+
+        response = client.post(
+            f"{_BASE}/rollback", json={"snapshot_id": "snap-bad", "components": ["feedback"]}
+        )
+        assert response.json()["success"] is False
+        assert _feedback_store == {"fb-live": sentinel}
+        assert list(_feedback_index) == ["fb-live"]
+
+    def test_rollback_unknown_snapshot_404(self, client: TestClient) -> None:
+        response = client.post(f"{_BASE}/rollback", json={"snapshot_id": "snap-missing"})
+        assert response.status_code == 404
+
+
+# -----------------------------------------------------------------------
+# Integrity checks and auto-fix
+# -----------------------------------------------------------------------
+
+
+class TestDataIntegrity:
+    def test_validate_reports_empty_and_duplicate_ids(self, client: TestClient) -> None:
+        from types import SimpleNamespace
+
+        from src.main import app
+
+        app.state.scheme_data = [
+            SimpleNamespace(scheme_id=sid) for sid in ("pm-kisan", "pm-kisan", "", "ayushman")
+        ]
+        data = client.post(f"{_BASE}/data/validate").json()
+        assert data["status"] == "corrupted"
+        assert data["issues"] == [
+            "Found 1 scheme(s) with empty scheme_id",
+            "Duplicate scheme_id: pm-kisan",
+        ]
+        assert data["warnings"] == []
+
+    def test_scheme_id_index_cached_until_data_replaced(self) -> None:
+        from types import SimpleNamespace
+
+        state = SimpleNamespace(scheme_data=[SimpleNamespace(scheme_id="pm-kisan")])
+        ids, counts = admin_recovery._scheme_id_index(state)
+        assert ids == frozenset({"pm-kisan"})
+        assert admin_recovery._scheme_id_index(state)[1] is counts
+
+        state.scheme_data = [SimpleNamespace(scheme_id="ayushman"), SimpleNamespace(scheme_id="")]
+        ids, counts = admin_recovery._scheme_id_index(state)
+        assert ids == frozenset({"ayushman"})
+        assert counts[""] == 1
+
+    def test_auto_fix_prunes_orphan_verifications_in_place(self, client: TestClient) -> None:
+        from types import SimpleNamespace
+
+        from src.main import app
+
+        app.state.scheme_data = [SimpleNamespace(scheme_id="ayushman")]
+        results = {"ayushman": {"status": "verified"}, "gone": {"status": "verified"}}
+        app.state.verification_results = results
+        fixes = client.post(f"{_BASE}/auto-fix").json()["fixes_applied"]
+        assert "Removed 1 orphaned verification results" in fixes
+        assert app.state.verification_results is results
+        assert results == {"ayushman": {"status": "verified"}}
+
+    def test_auto_fix_rebuilds_feedback_index(self, client: TestClient) -> None:
+        from src.api.v1 import feedback
+        from src.models.feedback import CitizenFeedback
+
+        for fid in ("fb-a", "fb-b"):
+            _feedback_store[fid] = CitizenFeedback(
+                feedback_id=fid, feedback_type="suggestion", description="Add more details"
+            )
+        _feedback_index.extend(["fb-a", "fb-ghost"])
+        fixes = client.post(f"{_BASE}/auto-fix").json()["fixes_applied"]
+        assert list(_feedback_index) == ["fb-a", "fb-b"]
+        assert "Added 1 missing entries to feedback index" in fixes
+        assert feedback._by_type["suggestion"] == ["fb-b", "fb-a"]
+
+
+# -----------------------------------------------------------------------
+# Startup-constructed services
+# -----------------------------------------------------------------------
+
+
+class TestServiceAvailability:
+    def test_claude_status_503_without_bridge(self, client: TestClient, monkeypatch) -> None:
+        from src.main import app
+
+        monkeypatch.setattr(app.state, "claude_cli_bridge", None, raising=False)
+        assert client.get(f"{_BASE}/claude/status").status_code == 503
+
+    def test_diagnose_503_without_orchestrator(self, client: TestClient, monkeypatch) -> None:
+        from src.main import app
+
+        monkeypatch.setattr(app.state, "autofix_orchestrator", None, raising=False)
+        assert client.post(f"{_BASE}/orchestrator/diagnose-only").status_code == 503
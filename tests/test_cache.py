@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.services.cache import CacheManager, InMemoryCacheBackend, _stable_hash
+from src.services.cache import CacheManager, InMemoryCacheBackend, RedisCacheBackend, _stable_hash
 
 
 # -----------------------------------------------------------------------
@@ -277,3 +277,32 @@ class TestCacheManager:
         mgr = CacheManager(redis_url=None, namespace="fb:")
         await mgr.set("k", "v")
         assert await mgr.get("k") == "v", "in-memory fallback should work when Redis is unavailable"
+
+    async def test_ping_without_redis(self) -> None:
+        """ping() should succeed on the in-memory fallback."""
+        mgr = CacheManager(redis_url=None)
+        assert await mgr.ping() is True
+
+    async def test_ping_failure_switches_to_fallback(self) -> None:
+        """A failed Redis ping should report False and demote to in-memory."""
+        mgr = CacheManager(redis_url=None)
+        redis = MagicMock(spec=RedisCacheBackend)
+        # Connection check, then one answered and one unanswered ping.
+        redis.ping = AsyncMock(side_effect=[True, True, False])
+        mgr._redis = redis
+        assert await mgr.ping() is True, "reachable Redis should answer ping"
+        assert await mgr.ping() is False, "unanswered ping should be reported"
+        assert await mgr._backend() is mgr._fallback
+
+    async def test_set_raw_round_trips_through_get(self) -> None:
+        """Bytes stored with set_raw() should be decoded by get()."""
+        mgr = CacheManager(redis_url=None)
+        await mgr.set_raw("k", b'{"a":[1,2]}')
+        assert await mgr.get("k") == {"a": [1, 2]}
+
+    async def test_get_raw_returns_stored_bytes(self) -> None:
+        """get_raw() should return the JSON bytes written by set()."""
+        mgr = CacheManager(redis_url=None, namespace="ns:")
+        await mgr.set("k", {"a": 1})
+        assert await mgr.get_raw("k") == b'{"a":1}'
+        assert await mgr.get_raw("missing") is None
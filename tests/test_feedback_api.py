@@ -0,0 +1,253 @@
+"""Tests for the citizen feedback API (src.api.v1.feedback)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.v1 import feedback
+from src.models.feedback import CitizenFeedback, FeedbackStatus
+
+_BASE = "/api/v1/feedback"
+
+
+@pytest.fixture(autouse=True)
+def _reset_store():
+    """Start every test with an empty feedback store and aggregates."""
+    feedback._feedback_store.clear()
+    feedback._feedback_index.clear()
+    feedback._rebuild_feedback_indexes()
+    yield
+    feedback._feedback_store.clear()
+    feedback._feedback_index.clear()
+    feedback._rebuild_feedback_indexes()
+
+
+@pytest.fixture
+def client():
+    """Create a test client with its own rate-limit bucket."""
+    from src.main import app
+
+    return TestClient(app, headers={"X-Forwarded-For": f"feedback-test-{uuid4().hex}"})
+
+
+def _submit(client: TestClient, feedback_type: str = "suggestion", **extra: str) -> str:
+    body = {"feedback_type": feedback_type, "description": "Scheme details look outdated", **extra}
+    response = client.post(_BASE, json=body)
+    assert response.status_code == 201
+    return response.json()["feedback_id"]
+
+
+# -----------------------------------------------------------------------
+# Evidence URL validation
+# -----------------------------------------------------------------------
+
+
+class TestValidateGovUrl:
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://pmkisan.gov.in/notice.pdf",
+            "http://sub.nic.in/page",
+            "https://www.india.gov.in/schemes",
+            "https://sansad.in/ls",
+            "https://indiacode.nic.in/act",
+            "https://egazette.gov.in/",
+            "https://myscheme.gov.in/schemes/pm-kisan",
+            "https://DATA.GOV.IN/resource",
+        ],
+    )
+    def test_accepts_government_hosts(self, url: str) -> None:
+        assert feedback._validate_gov_url(url) == url
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://gov.in.example.com/",
+            "https://evilgov.in/",
+            "https://example.com/?r=https://pmkisan.gov.in",
+            "https://www.sansad.in/",
+            "ftp://pmkisan.gov.in/file",
+            "javascript:alert(1)",
+        ],
+    )
+    def test_rejects_other_hosts(self, url: str) -> None:
+        assert feedback._validate_gov_url(url) is None
+
+    @pytest.mark.parametrize("url", [None, "", "   "])
+    def test_empty_is_none(self, url: str | None) -> None:
+        assert feedback._validate_gov_url(url) is None
+
+    def test_strips_whitespace(self) -> None:
+        assert feedback._validate_gov_url("  https://pmkisan.gov.in/  ") == "https://pmkisan.gov.in/"
+
+
+# -----------------------------------------------------------------------
+# Stats
+# -----------------------------------------------------------------------
+
+
+class TestFeedbackStats:
+    def test_counts_follow_submissions_and_status_changes(self, client: TestClient) -> None:
+        _submit(client, "accuracy_report")
+        grievance_id = _submit(client, "grievance")
+        _submit(client, "grievance")
+
+        client.post(f"{_BASE}/{grievance_id}/verify")
+        stats = client.get(f"{_BASE}/stats").json()
+        assert stats["total_feedback"] == 3
+        assert stats["pending_review"] == 3
+        assert stats["resolved"] == 0
+        assert stats["accuracy_reports"] == 1
+        assert stats["grievances"] == 2
+        assert stats["average_resolution_time_hours"] is None
+
+    def test_average_resolution_from_running_sum(self, client: TestClient) -> None:
+        now = datetime.now(UTC)
+        for hours in (2, 4):
+            fb = CitizenFeedback(
+                feedback_type="grievance",
+                description="Payment has not arrived yet",
+                status=FeedbackStatus.RESOLVED,
+                submitted_at=now - timedelta(hours=hours),
+            )
+            feedback._feedback_store[fb.feedback_id] = fb
+        feedback._rebuild_feedback_indexes()
+
+        stats = client.get(f"{_BASE}/stats").json()
+        assert stats["resolved"] == 2
+        assert stats["pending_review"] == 0
+        assert stats["average_resolution_time_hours"] == pytest.approx(3.0, abs=0.01)
+
+    def test_set_status_moves_between_buckets(self) -> None:
+        fb = CitizenFeedback(feedback_type="grievance", description="Payment has not arrived yet")
+        feedback._feedback_store[fb.feedback_id] = fb
+        feedback._track_feedback(fb)
+
+        feedback._set_feedback_status(fb, FeedbackStatus.RESOLVED)
+        assert feedback._status_counts[FeedbackStatus.SUBMITTED] == 0
+        assert feedback._status_counts[FeedbackStatus.RESOLVED] == 1
+        assert feedback._resolved_submitted_ts["sum"] == pytest.approx(fb.submitted_at.timestamp())
+
+
+# -----------------------------------------------------------------------
+# Listing
+# -----------------------------------------------------------------------
+
+
+class TestListFeedback:
+    def _ids(self, client: TestClient, **params: str) -> list[str]:
+        response = client.get(_BASE, params=params)
+        assert response.status_code == 200
+        return [f["feedback_id"] for f in response.json()["feedbacks"]]
+
+    def test_filters_use_indexes_newest_first(self, client: TestClient) -> None:
+        a = _submit(client, "grievance", scheme_id="pm-kisan")
+        b = _submit(client, "suggestion", scheme_id="pm-kisan")
+        c = _submit(client, "grievance", scheme_id="ayushman")
+        client.post(f"{_BASE}/{a}/verify")
+
+        assert self._ids(client) == [c, b, a]
+        assert self._ids(client, scheme_id="pm-kisan") == [b, a]
+        assert self._ids(client, feedback_type="grievance", scheme_id="pm-kisan") == [a]
+        assert self._ids(client, status="under_review") == [a]
+        assert self._ids(client, status="submitted") == [c, b]
+
+    def test_status_change_keeps_submission_order(self) -> None:
+        fbs = [
+            CitizenFeedback(feedback_type="grievance", description="Payment has not arrived yet")
+            for _ in range(3)
+        ]
+        for fb in fbs:
+            feedback._feedback_store[fb.feedback_id] = fb
+            feedback._feedback_index.appendleft(fb.feedback_id)
+            feedback._index_feedback(fb)
+
+        feedback._set_feedback_status(fbs[2], FeedbackStatus.UNDER_REVIEW)
+        feedback._set_feedback_status(fbs[0], FeedbackStatus.UNDER_REVIEW)
+        assert list(feedback._status_bucket(FeedbackStatus.UNDER_REVIEW)) == [
+            fbs[0].feedback_id,
+            fbs[2].feedback_id,
+        ]
+        assert list(feedback._status_bucket(FeedbackStatus.SUBMITTED)) == [fbs[1].feedback_id]
+        assert not feedback._unsorted_statuses
+
+    def test_rebuild_follows_feedback_index(self, client: TestClient) -> None:
+        fbs = [
+            CitizenFeedback(feedback_type="suggestion", scheme_id="pm-kisan", description="Add more details")
+            for _ in range(2)
+        ]
+        for fb in fbs:
+            feedback._feedback_store[fb.feedback_id] = fb
+        feedback._feedback_index.extend([fbs[1].feedback_id, fbs[0].feedback_id])
+        feedback._rebuild_feedback_indexes()
+
+        assert self._ids(client, scheme_id="pm-kisan") == [fbs[1].feedback_id, fbs[0].feedback_id]
+
+    def test_pagination_window_and_optional_total(self, client: TestClient) -> None:
+        ids = [_submit(client) for _ in range(5)][::-1]
+
+        data = client.get(_BASE, params={"page": 2, "page_size": 2}).json()
+        assert [f["feedback_id"] for f in data["feedbacks"]] == ids[2:4]
+        assert data["total"] == 5
+
+        data = client.get(_BASE, params={"page": 2, "page_size": 2, "include_total": False}).json()
+        assert [f["feedback_id"] for f in data["feedbacks"]] == ids[2:4]
+        assert data["total"] is None
+
+    @pytest.mark.parametrize(
+        ("params", "detail"),
+        [
+            ({"feedback_type": "spam"}, "Invalid feedback_type 'spam'. Valid types: ['accuracy_report'"),
+            ({"status": "lost"}, "Invalid status 'lost'. Valid statuses: ['submitted'"),
+        ],
+    )
+    def test_rejects_unknown_filter_values(self, client: TestClient, params: dict, detail: str) -> None:
+        response = client.get(_BASE, params=params)
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith(detail)
+
+
+# -----------------------------------------------------------------------
+# Cache persistence
+# -----------------------------------------------------------------------
+
+
+class TestFeedbackCache:
+    @pytest.fixture
+    def cache(self, monkeypatch: pytest.MonkeyPatch):
+        from src.main import app
+        from src.services.cache import CacheManager
+
+        cache = CacheManager(redis_url=None)
+        monkeypatch.setattr(app.state, "cache", cache, raising=False)
+        return cache
+
+    async def test_submission_cached_as_json(self, client: TestClient, cache) -> None:
+        fid = _submit(client, "grievance")
+        cached = await cache.get(f"feedback:{fid}")
+        assert cached["feedback_id"] == fid
+        assert cached["status"] == "submitted"
+        assert await cache.get("feedback:index") == [fid]
+
+    def test_detail_falls_back_to_cache(self, client: TestClient, cache) -> None:
+        fid = _submit(client, "grievance")
+        feedback._feedback_store.clear()
+
+        response = client.get(f"{_BASE}/{fid}")
+        assert response.status_code == 200
+        assert response.json()["feedback_id"] == fid
+        assert response.json()["feedback_type"] == "grievance"
+
+    def test_cache_failure_does_not_fail_submission(
+        self, client: TestClient, cache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def _boom(*args: object, **kwargs: object) -> None:
+            raise ConnectionError("cache down")
+
+        monkeypatch.setattr(type(cache), "set_raw", _boom)
+        fid = _submit(client, "grievance")
+        assert fid in feedback._feedback_store
@@ -0,0 +1,64 @@
+"""Tests for the liveness and readiness probes (src.api.v1.health)."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from src.api.v1 import health
+
+
+class _Cache:
+    def __init__(self, reachable: bool = True) -> None:
+        self._reachable = reachable
+
+    async def ping(self) -> bool:
+        return self._reachable
+
+
+class _Translation:
+    def __init__(self, started: asyncio.Event) -> None:
+        self._started = started
+
+    async def detect_language(self, text: str) -> tuple[str, float]:
+        self._started.set()
+        return "en", 0.99
+
+
+def _request(**state: object) -> SimpleNamespace:
+    defaults: dict[str, object] = {"scheme_data": ["pm-kisan"], "orchestrator": object()}
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(**(defaults | state))))
+
+
+class TestReadiness:
+    async def test_all_checks_ok(self) -> None:
+        started = asyncio.Event()
+        result = await health.readiness_check(_request(cache=_Cache(), translation=_Translation(started)))
+        assert result.status == "ready"
+        assert result.checks["cache"] == "ok"
+        assert result.checks["translation"] == "ok"
+
+    async def test_missing_services_are_not_configured(self) -> None:
+        result = await health.readiness_check(_request())
+        assert result.status == "ready"
+        assert result.checks["cache"] == "not_configured"
+        assert result.checks["translation"] == "not_configured"
+
+    async def test_checks_run_concurrently(self) -> None:
+        started = asyncio.Event()
+
+        class _WaitingCache(_Cache):
+            async def ping(self) -> bool:
+                # Only completes if the translation check ran meanwhile.
+                await asyncio.wait_for(started.wait(), timeout=1)
+                return True
+
+        result = await health.readiness_check(
+            _request(cache=_WaitingCache(), translation=_Translation(started))
+        )
+        assert result.checks["cache"] == "ok"
+
+    async def test_degraded_cache_marks_not_ready(self) -> None:
+        result = await health.readiness_check(_request(cache=_Cache(reachable=False)))
+        assert result.status == "degraded"
+        assert result.checks["cache"] == "degraded"
@@ -476,6 +476,39 @@ class TestPipelineChecksums:
         int(cs, 16)  # Should not raise
 
 
+# ---------------------------------------------------------------------------
+# Pipeline -- persistence
+# ---------------------------------------------------------------------------
+
+
+class TestPipelinePersistence:
+    @pytest.fixture
+    def pipeline(self):
+        cache = FakeCache()
+        myscheme = MySchemeClient(cache=cache, rate_limit_delay=0)
+        datagov = DataGovClient(cache=cache, api_key="test")
+        return SchemeIngestionPipeline(
+            myscheme=myscheme,
+            datagov=datagov,
+            cache=cache,
+        )
+
+    async def test_save_schemes_writes_sorted_file_and_cache(self, pipeline, tmp_path):
+        path = tmp_path / "out" / "schemes.json"
+        schemes = [{"scheme_id": "b", "name": "योजना"}, {"scheme_id": "a", "name": "A"}]
+        await pipeline.save_schemes(schemes, path=str(path))
+
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        assert [s["scheme_id"] for s in saved] == ["a", "b"]
+        assert "योजना" in path.read_text(encoding="utf-8")
+        assert await pipeline._cache.get("ingestion:all_schemes") == saved
+
+    def test_load_seed_data_tags_source(self, pipeline):
+        seed = pipeline._load_seed_data()
+        assert seed
+        assert all("source" in s for s in seed)
+
+
 # ---------------------------------------------------------------------------
 # DataGovClient -- parameter building
 # ---------------------------------------------------------------------------
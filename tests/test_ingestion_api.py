@@ -0,0 +1,76 @@
+"""Tests for the admin ingestion endpoints (src.api.v1.ingestion)."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from src.api.v1 import ingestion
+from src.services.ingestion.pipeline import IngestionResult
+
+
+class _Pipeline:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.runs = 0
+        self.last_result: IngestionResult | None = None
+
+    async def run_full_ingestion(self) -> IngestionResult:
+        self.runs += 1
+        await self.release.wait()
+        self.last_result = IngestionResult(total_fetched=3, new_schemes=3)
+        return self.last_result
+
+    async def run_incremental_update(self) -> IngestionResult:
+        raise RuntimeError("source unavailable")
+
+
+def _request(pipeline: _Pipeline) -> SimpleNamespace:
+    state = SimpleNamespace(ingestion_pipeline=pipeline)
+    return SimpleNamespace(app=SimpleNamespace(state=state))
+
+
+class TestIngestionJobs:
+    async def test_trigger_returns_immediately_and_status_tracks_job(self) -> None:
+        pipeline = _Pipeline()
+        request = _request(pipeline)
+
+        started = await ingestion.trigger_full_ingestion(request)
+        assert started.status == "running"
+        job_id = started.result["job_id"]
+
+        await asyncio.sleep(0)
+        status = await ingestion.get_ingestion_status(request)
+        assert status.status == "running"
+        assert status.running_job_id == job_id
+
+        pipeline.release.set()
+        await request.app.state.ingest_job["task"]
+        status = await ingestion.get_ingestion_status(request)
+        assert status.status == "ready"
+        assert status.running_job_id is None
+        assert status.last_job["status"] == "completed"
+        assert status.last_result["total_fetched"] == 3
+
+    async def test_concurrent_trigger_reuses_running_job(self) -> None:
+        pipeline = _Pipeline()
+        request = _request(pipeline)
+
+        first = await ingestion.trigger_full_ingestion(request)
+        second = await ingestion.trigger_incremental_ingestion(request)
+        assert second.status == "already_running"
+        assert second.result == first.result
+
+        pipeline.release.set()
+        await request.app.state.ingest_job["task"]
+        assert pipeline.runs == 1
+
+    async def test_failed_job_reported_in_status(self) -> None:
+        request = _request(_Pipeline())
+
+        await ingestion.trigger_incremental_ingestion(request)
+        await asyncio.gather(request.app.state.ingest_job["task"], return_exceptions=True)
+
+        status = await ingestion.get_ingestion_status(request)
+        assert status.last_job["kind"] == "incremental"
+        assert status.last_job["status"] == "failed"
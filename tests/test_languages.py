@@ -66,6 +66,12 @@ class TestLanguagesRegistry:
         assert sa.is_high_priority is False
         assert sa.gcp_tts_code is None, "Sanskrit should not have GCP TTS support"
 
+    def test_registry_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            LANGUAGES["xx"] = LANGUAGES["hi"]  # type: ignore[index]
+        with pytest.raises(TypeError):
+            LANGUAGE_CODE_MAP["xx"] = "hi"  # type: ignore[index]
+
     def test_all_have_required_fields(self) -> None:
         for code, config in LANGUAGES.items():
             assert config.code, f"Language '{code}' should have a code"
@@ -102,6 +108,9 @@ class TestGetLanguage:
         config = get_language("xx")
         assert config is None, "get_language for unknown code should return None"
 
+    def test_get_overlong_code_returns_none(self) -> None:
+        assert get_language("HI" * 64) is None
+
     def test_get_via_alias_hin(self) -> None:
         config = get_language("hin")
         assert config is not None, "get_language('hin') should resolve alias to Hindi"
@@ -127,6 +136,17 @@ class TestGetLanguage:
         assert config is not None, "get_language('en-IN') should resolve to English"
         assert config.code == "en"
 
+    @pytest.mark.parametrize("code", ["HI", "Hi", "HI-IN", "hi-in", "HIN"])
+    def test_get_is_case_insensitive(self, code: str) -> None:
+        config = get_language(code)
+        assert config is not None, f"get_language('{code}') should resolve to Hindi"
+        assert config.code == "hi"
+
+    def test_get_mixed_case_alias(self) -> None:
+        config = get_language("mni-mtei")
+        assert config is not None, "get_language('mni-mtei') should resolve to Manipuri"
+        assert config.code == "mni"
+
 
 # -----------------------------------------------------------------------
 # get_high_priority_languages tests
@@ -253,6 +273,13 @@ class TestLanguageCodeMap:
     def test_alias_mni_Mtei_maps_to_mni(self) -> None:
         assert LANGUAGE_CODE_MAP["mni-Mtei"] == "mni"
 
+    def test_aliases_share_canonical_instance(self) -> None:
+        for alias, canonical in LANGUAGE_CODE_MAP.items():
+            assert get_language(alias) is LANGUAGES[canonical], (
+                f"Alias '{alias}' should resolve to the same LanguageConfig as '{canonical}'"
+            )
+            assert get_language(alias.upper()) is LANGUAGES[canonical]
+
     def test_all_aliases_resolve_to_valid_languages(self) -> None:
         for alias, canonical in LANGUAGE_CODE_MAP.items():
             assert canonical in LANGUAGES, (
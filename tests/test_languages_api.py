@@ -0,0 +1,91 @@
+"""Tests for the language metadata API (src.api.v1.languages)."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from config.languages import get_supported_languages
+
+_BASE = "/api/v1/languages"
+
+
+@pytest.fixture
+def client():
+    """Create a test client with its own rate-limit bucket."""
+    from src.main import app
+
+    return TestClient(app, headers={"X-Forwarded-For": f"languages-test-{uuid4().hex}"})
+
+
+class TestListLanguages:
+    def test_lists_all_languages_by_population(self, client: TestClient) -> None:
+        response = client.get(_BASE)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+
+        data = response.json()
+        assert data["total"] == 23
+        assert [lang["code"] for lang in data["languages"]] == [
+            lang.code for lang in get_supported_languages()
+        ]
+        hindi = next(lang for lang in data["languages"] if lang["code"] == "hi")
+        assert hindi["has_tts"] is True
+        assert hindi["name_native"] == "हिन्दी"
+
+
+class TestLanguageCaching:
+    def test_list_and_detail_share_cacheable_etag(self, client: TestClient) -> None:
+        listing = client.get(_BASE)
+        detail = client.get(f"{_BASE}/hin")
+        assert detail.status_code == 200
+        assert detail.json()["code"] == "hi"
+
+        etag = listing.headers["etag"]
+        assert etag.startswith('"')
+        assert detail.headers["etag"] == etag
+        for response in (listing, detail):
+            assert response.headers["cache-control"] == "public, max-age=86400"
+            assert "pragma" not in response.headers
+
+    @pytest.mark.parametrize("path", ["", "/hi"])
+    def test_matching_if_none_match_is_not_modified(self, client: TestClient, path: str) -> None:
+        etag = client.get(f"{_BASE}{path}").headers["etag"]
+
+        response = client.get(f"{_BASE}{path}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    @pytest.mark.parametrize(
+        "header",
+        ["*", 'W/{etag}', '"stale", {etag}', '"stale",W/{etag}'],
+    )
+    def test_if_none_match_list_weak_and_wildcard(self, client: TestClient, header: str) -> None:
+        etag = client.get(_BASE).headers["etag"]
+
+        response = client.get(_BASE, headers={"If-None-Match": header.format(etag=etag)})
+        assert response.status_code == 304
+
+    def test_stale_etag_gets_full_body(self, client: TestClient) -> None:
+        response = client.get(_BASE, headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.json()["total"] == 23
+
+    def test_unknown_code_is_not_cached(self, client: TestClient) -> None:
+        response = client.get(f"{_BASE}/xx")
+        assert response.status_code == 404
+        assert response.headers["cache-control"].startswith("no-store")
+
+
+class TestLanguageDetail:
+    @pytest.mark.parametrize("code", ["hi", "HI", "hin"])
+    def test_aliases_resolve_to_canonical_detail(self, client: TestClient, code: str) -> None:
+        response = client.get(f"{_BASE}/{code}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["code"] == "hi"
+        assert data["gcp_tts_code"] == "hi-IN"
+        assert data["has_stt"] is True
@@ -54,6 +54,96 @@ def test_emergency_always_returns_numbers(client):
     assert "emergency_numbers" in data or "emergency_contacts" in data
 
 
+def test_emergency_report_failure_returns_core_numbers(client, monkeypatch):
+    """A failing SOS service still yields the core helpline numbers."""
+    from src.main import app
+
+    class _FailingSOS:
+        def report_emergency(self, **kwargs):
+            raise RuntimeError("upstream down")
+
+    monkeypatch.setattr(app.state, "emergency_sos", _FailingSOS(), raising=False)
+    response = client.post(
+        "/api/v1/emergency/report",
+        json={"description": "I am in danger", "language": "hi"},
+    )
+    assert response.status_code == 200
+    numbers = [n["number"] for n in response.json()["emergency_numbers"]]
+    assert numbers == ["112", "100", "181"]
+
+
+def test_emergency_contacts_directory(client, monkeypatch):
+    """Contacts are projected from the service's helpline objects."""
+    from src.main import app
+    from src.services.emergency_sos import EmergencySOSService
+
+    monkeypatch.setattr(app.state, "emergency_sos", EmergencySOSService(), raising=False)
+    response = client.get("/api/v1/emergency/contacts/police")
+    assert response.status_code == 200
+    contacts = response.json()["contacts"]
+    assert contacts
+    assert set(contacts[0]) == {"name", "number", "description", "available_24x7"}
+
+
+def test_emergency_report_projects_service_contacts(client, monkeypatch):
+    """A report against the real SOS service returns its projected contacts."""
+    from src.main import app
+    from src.services.emergency_sos import EmergencySOSService
+
+    monkeypatch.setattr(app.state, "emergency_sos", EmergencySOSService(), raising=False)
+    response = client.post(
+        "/api/v1/emergency/report",
+        json={"description": "My husband beats me every day", "language": "en"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert "emergency_numbers" not in data
+    assert data["report_id"]
+    contacts = data["emergency_contacts"]
+    assert contacts
+    assert all(set(c) == {"name", "number", "description"} for c in contacts)
+
+
+def test_emergency_safety_plan_uses_real_service(client, monkeypatch):
+    """The safety plan endpoint works against the synchronous service."""
+    from src.main import app
+    from src.services.emergency_sos import EmergencySOSService
+
+    monkeypatch.setattr(app.state, "emergency_sos", EmergencySOSService(), raising=False)
+    response = client.post(
+        "/api/v1/emergency/safety-plan",
+        json={"situation": "domestic_violence at home", "language": "en"},
+    )
+    assert response.status_code == 200
+    assert response.json()["immediate_steps"]
+
+
+def test_emergency_contacts_flags_qualified_24x7_entries(client, monkeypatch):
+    """Helplines listed as "24x7 (toll-free)" still count as round-the-clock."""
+    from src.main import app
+    from src.services.emergency_sos import EmergencySOSService
+
+    monkeypatch.setattr(app.state, "emergency_sos", EmergencySOSService(), raising=False)
+    response = client.get("/api/v1/emergency/contacts/trafficking")
+    assert response.status_code == 200
+    flags = {c["number"]: c["available_24x7"] for c in response.json()["contacts"]}
+    assert flags["1800-419-8588"] is True
+    assert flags["15100"] is False
+
+
+def test_emergency_contacts_memoized_per_type_and_state():
+    """Repeat lookups reuse the built contacts but return a fresh list."""
+    from src.services.emergency_sos import EmergencySOSService
+
+    service = EmergencySOSService()
+    first = service.get_emergency_contacts("domestic_violence", "UP")
+    second = service.get_emergency_contacts("domestic_violence", "uttar pradesh")
+    assert first == second
+    assert first is not second
+    assert len(service._contacts_cache) == 1
+    assert any(c.category == "state" for c in first)
+
+
 def test_legal_rights_helplines(client):
     """Legal rights helplines endpoint."""
     response = client.get("/api/v1/legal-rights/helplines?category=general")
@@ -72,18 +162,158 @@ def test_nearby_csc_validation(client):
     assert response.status_code in (400, 503)
 
 
+@pytest.mark.parametrize("pin_code", ["11000", "1100011", "११०००१", "11000a"])
+def test_nearby_csc_rejects_bad_pin_before_service_lookup(client, monkeypatch, pin_code):
+    """Malformed PIN codes get 400 even when the locator is unavailable."""
+    from src.main import app
+
+    monkeypatch.setattr(app.state, "nearby_services", None, raising=False)
+    response = client.get(f"/api/v1/nearby/csc/{pin_code}")
+    assert response.status_code == 400
+
+
 def test_nearby_csc_valid_pin(client):
     """Nearby CSC endpoint with valid PIN."""
     response = client.get("/api/v1/nearby/csc/110001")
     assert response.status_code in (200, 503)
 
 
+def test_nearby_results_projected_from_locator(client, monkeypatch):
+    """Locator objects are projected through the nearby response models."""
+    from src.main import app
+    from src.services.nearby_services import NearbyServicesLocator
+
+    monkeypatch.setattr(app.state, "nearby_services", NearbyServicesLocator(), raising=False)
+    response = client.get(
+        "/api/v1/nearby/find", params={"latitude": 28.6, "longitude": 77.2, "radius_km": 50}
+    )
+    assert response.status_code == 200
+    result = response.json()["results"][0]
+    assert result["type"] == "csc"
+    assert result["hours"]
+    assert result["distance_km"] is not None
+
+    response = client.get("/api/v1/nearby/csc/110001")
+    assert response.status_code == 200
+    assert set(response.json()["cscs"][0]) == {"name", "address", "phone", "vle_name", "services"}
+
+
+async def test_nearby_find_coalesces_identical_concurrent_queries():
+    """Concurrent identical /find queries share one locator call."""
+    import asyncio
+    import threading
+    from types import SimpleNamespace
+
+    from src.api.v1 import nearby
+
+    release = threading.Event()
+
+    class _Locator:
+        calls = 0
+
+        def find_nearby(self, latitude, longitude, service_type, radius_km):
+            type(self).calls += 1
+            release.wait(timeout=5)
+            return []
+
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(nearby_services=_Locator())))
+    pending = asyncio.gather(
+        nearby.find_nearby_services(28.6, 77.2, request=request),
+        nearby.find_nearby_services(28.6, 77.2, request=request),
+    )
+    await asyncio.sleep(0.05)
+    release.set()
+    first, second = await pending
+
+    assert _Locator.calls == 1
+    assert first.count == second.count == 0
+    assert not nearby._inflight_find
+
+
+def test_legal_rights_helplines_projected(client, monkeypatch):
+    """Helpline records are projected with hours and languages."""
+    from src.main import app
+    from src.services.legal_rights import LegalRightsService
+
+    monkeypatch.setattr(app.state, "legal_rights", LegalRightsService(llm=None), raising=False)
+    response = client.get("/api/v1/legal-rights/helplines?category=women")
+    assert response.status_code == 200
+    helpline = response.json()["helplines"][0]
+    assert set(helpline) == {"name", "number", "description", "hours", "languages"}
+
+
 def test_accessibility_haptic_pattern(client):
     """Accessibility haptic pattern endpoint."""
     response = client.get("/api/v1/accessibility/haptic-pattern/success")
     assert response.status_code in (200, 503)
 
 
+def test_accessibility_generate_simplified(client, monkeypatch):
+    """Accessibility generate endpoint returns the simplified text."""
+    from src.main import app
+    from src.services.accessibility import AccessibilityService
+
+    monkeypatch.setattr(
+        app.state, "accessibility", AccessibilityService(translation=None, tts=None), raising=False
+    )
+    response = client.post(
+        "/api/v1/accessibility/generate",
+        json={"text": "Apply for the scheme at the nearest office.", "mode": "simplified"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["mode"] == "simplified"
+    assert data["simplified_text"] == data["text"]
+    assert data["isl_description"] is None
+    assert data["haptic_pattern"] is None
+
+
+def test_accessibility_generate_invalid_mode(client, monkeypatch):
+    """Accessibility generate endpoint rejects unknown modes."""
+    from src.main import app
+    from src.services.accessibility import AccessibilityService
+
+    monkeypatch.setattr(
+        app.state, "accessibility", AccessibilityService(translation=None, tts=None), raising=False
+    )
+    response = client.post(
+        "/api/v1/accessibility/generate",
+        json={"text": "Hello", "mode": "telepathy"},
+    )
+    assert response.status_code == 400
+
+
+def test_accessibility_simplify(client, monkeypatch):
+    """Accessibility simplify endpoint returns simplified text."""
+    from src.main import app
+    from src.services.accessibility import AccessibilityService
+
+    monkeypatch.setattr(
+        app.state, "accessibility", AccessibilityService(translation=None, tts=None), raising=False
+    )
+    text = "Apply for the scheme at the nearest office."
+    response = client.post("/api/v1/accessibility/simplify", params={"text": text})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["original_length"] == len(text)
+    assert data["simplified"]
+
+
+def test_accessibility_generate_rejects_unknown_fields(client, monkeypatch):
+    """Accessibility generate request body forbids unknown fields."""
+    from src.main import app
+    from src.services.accessibility import AccessibilityService
+
+    monkeypatch.setattr(
+        app.state, "accessibility", AccessibilityService(translation=None, tts=None), raising=False
+    )
+    response = client.post(
+        "/api/v1/accessibility/generate",
+        json={"text": "Hello", "mode": "simplified", "volume": 11},
+    )
+    assert response.status_code == 422
+
+
 def test_sustainability_dashboard(client):
     """Sustainability dashboard returns basic info even without service."""
     response = client.get("/api/v1/sustainability/dashboard")
@@ -98,6 +328,45 @@ def test_document_scanner_no_file(client):
     assert response.status_code == 422  # Missing required file
 
 
+def test_document_scanner_rejects_oversized_image(client, monkeypatch):
+    """Document scanner returns 413 for images over the size limit."""
+    from src.api.v1 import document_scanner
+    from src.main import app
+
+    monkeypatch.setattr(app.state, "document_scanner", object(), raising=False)
+    monkeypatch.setattr(document_scanner, "_MAX_IMAGE_BYTES", 1024)
+    response = client.post(
+        "/api/v1/document/scan",
+        files={"image": ("notice.jpg", b"x" * 2048, "image/jpeg")},
+    )
+    assert response.status_code == 413
+
+
+def test_document_scanner_returns_action_items(client, monkeypatch):
+    """Document scanner projects action items to their public fields."""
+    from src.main import app
+    from src.services.document_scanner import ActionItem, ActionPriority, DocumentExplanation
+
+    class _Scanner:
+        async def scan_and_explain(self, image_data, language):
+            return DocumentExplanation(
+                summary="Notice",
+                action_items=[
+                    ActionItem(description="Pay dues", deadline="2026-11-01", priority=ActionPriority.HIGH),
+                ],
+            )
+
+    monkeypatch.setattr(app.state, "document_scanner", _Scanner(), raising=False)
+    response = client.post(
+        "/api/v1/document/scan",
+        files={"image": ("notice.jpg", b"x" * 16, "image/jpeg")},
+    )
+    assert response.status_code == 200
+    assert response.json()["action_items"] == [
+        {"description": "Pay dues", "deadline": "2026-11-01", "priority": "high", "contact_info": None},
+    ]
+
+
 def test_grievance_create_validation(client):
     """Grievance creation validates input."""
     response = client.post(
@@ -117,6 +386,27 @@ def test_bns_section_not_found(client):
     assert response.status_code in (404, 503)
 
 
+def test_bns_section_cached_with_etag(client, monkeypatch):
+    """Known BNS sections are served with an ETag and honour If-None-Match."""
+    from src.main import app
+    from src.services.legal_rights import LegalRightsService
+
+    monkeypatch.setattr(app.state, "legal_rights", LegalRightsService(llm=None), raising=False)
+    response = client.get("/api/v1/legal-rights/bns/103")
+    assert response.status_code == 200
+    assert response.json()["section_number"] == 103
+    assert "NOT legal advice" in response.json()["disclaimer"]
+    assert response.headers["cache-control"] == "public, max-age=86400"
+
+    etag = response.headers["etag"]
+    response = client.get("/api/v1/legal-rights/bns/103", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    weak_list = f'"stale", W/{etag}'
+    response = client.get("/api/v1/legal-rights/bns/103", headers={"If-None-Match": weak_list})
+    assert response.status_code == 304
+
+
 def test_api_info_includes_new_endpoints(client):
     """API info should list all new feature endpoints."""
     response = client.get("/api")